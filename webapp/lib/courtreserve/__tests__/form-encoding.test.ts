@@ -0,0 +1,36 @@
+import { describe, it, expect } from 'vitest'
+import { encodeFormComponent } from '../api'
+
+/**
+ * Tests for the hand-rolled form encoder used to build reservation bodies
+ *
+ * Output must be application/x-www-form-urlencoded exactly as CourtReserve
+ * receives it from a browser: space as "+", and !'()~ percent-encoded.
+ */
+
+describe('encodeFormComponent', () => {
+  it.each([
+    ['asterisk', '*', '*'],
+    ['tilde', '~', '%7E'],
+    ['apostrophe', "'", '%27'],
+    ['parentheses', '()', '%28%29'],
+    ['exclamation mark', '!', '%21'],
+    ['space', 'a b', 'a+b'],
+    ['leading and trailing spaces', '  padded  ', '++padded++'],
+    ['accented characters', 'Café Résumé', 'Caf%C3%A9+R%C3%A9sum%C3%A9'],
+    ['CJK characters', '日本語', '%E6%97%A5%E6%9C%AC%E8%AA%9E'],
+    ['emoji', '🏓', '%F0%9F%8F%93'],
+    ['reserved characters', '&=+/%#?', '%26%3D%2B%2F%25%23%3F'],
+    ['antiforgery-style token', 'CfDJ8N+abc/def==', 'CfDJ8N%2Babc%2Fdef%3D%3D'],
+    ['mixed punctuation', "a~b*c(d)e!f'g h", 'a%7Eb*c%28d%29e%21f%27g+h'],
+    ['control characters', 'x\ny\tz', 'x%0Ay%09z'],
+    ['12-hour time', '1:30 PM', '1%3A30+PM'],
+    ['empty string', '', ''],
+  ])('should encode %s', (_label, value, expected) => {
+    expect(encodeFormComponent(value)).toBe(expected)
+  })
+
+  it('should leave already-safe values untouched', () => {
+    expect(encodeFormComponent('Pickleball-01_2.5*')).toBe('Pickleball-01_2.5*')
+  })
+})
@@ -0,0 +1,152 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
+import { TokenBucket } from '../rate-limiter'
+import { API_DOMAINS } from '../types'
+
+/**
+ * Tests for per-host request pacing
+ *
+ * Buckets run on fake timers with Date.now() as their clock, so refills
+ * happen exactly when the test advances time. A 20/s bucket refills one
+ * token every 50ms.
+ */
+
+const fakeClock = () => Date.now()
+
+describe('TokenBucket', () => {
+  beforeEach(() => {
+    vi.useFakeTimers()
+  })
+
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  it('should serve the burst immediately and the rest one refill apart, in arrival order', async () => {
+    const bucket = new TokenBucket(20, 2, fakeClock)
+    const order: number[] = []
+    for (const i of [0, 1, 2, 3, 4]) {
+      void bucket.acquire().then(() => order.push(i))
+    }
+
+    await vi.advanceTimersByTimeAsync(0)
+    expect(order).toEqual([0, 1])
+
+    await vi.advanceTimersByTimeAsync(40)
+    expect(order).toEqual([0, 1])
+
+    await vi.advanceTimersByTimeAsync(20) // 60ms
+    expect(order).toEqual([0, 1, 2])
+
+    await vi.advanceTimersByTimeAsync(50) // 110ms
+    expect(order).toEqual([0, 1, 2, 3])
+
+    await vi.advanceTimersByTimeAsync(50) // 160ms
+    expect(order).toEqual([0, 1, 2, 3, 4])
+  })
+
+  it('should serve a caller arriving mid-wait after the waiter already queued', async () => {
+    const bucket = new TokenBucket(20, 1, fakeClock)
+    const order: string[] = []
+
+    await bucket.acquire()
+    void bucket.acquire().then(() => order.push('queued'))
+    await vi.advanceTimersByTimeAsync(20)
+    void bucket.acquire().then(() => order.push('late'))
+
+    await vi.advanceTimersByTimeAsync(40) // 60ms
+    expect(order).toEqual(['queued'])
+
+    await vi.advanceTimersByTimeAsync(50) // 110ms
+    expect(order).toEqual(['queued', 'late'])
+  })
+
+  it('should refill over time but never beyond the burst size', async () => {
+    const bucket = new TokenBucket(20, 2, fakeClock)
+    await bucket.acquire()
+    await bucket.acquire()
+
+    await vi.advanceTimersByTimeAsync(300) // Enough for six tokens, capped at two
+    let granted = 0
+    for (let i = 0; i < 3; i++) {
+      void bucket.acquire().then(() => granted++)
+    }
+
+    await vi.advanceTimersByTimeAsync(0)
+    expect(granted).toBe(2)
+
+    await vi.advanceTimersByTimeAsync(60)
+    expect(granted).toBe(3)
+  })
+})
+
+describe('acquireRequestSlot', () => {
+  const lookupUrl = `${API_DOMAINS.api}/api/v1/portalreservationsapi/GetDurationDropdown`
+  const bookingUrl = `${API_DOMAINS.reservations}/Online/ReservationsApi/CreateReservation/1`
+
+  // The limit is read when the module loads, so each test loads a fresh copy with an explicit one
+  async function loadRateLimiter(ratePerSec: string) {
+    vi.resetModules()
+    vi.stubEnv('COURTRESERVE_RATE_LIMIT', ratePerSec)
+    return import('../rate-limiter')
+  }
+
+  afterEach(() => {
+    vi.unstubAllEnvs()
+  })
+
+  it('should never pace booking POSTs', async () => {
+    const { acquireRequestSlot } = await loadRateLimiter('1')
+    for (let i = 0; i < 5; i++) {
+      expect(acquireRequestSlot(bookingUrl)).toBeUndefined()
+    }
+  })
+
+  it('should pace lookups once the burst is used up', async () => {
+    vi.useFakeTimers()
+    try {
+      const { acquireRequestSlot } = await loadRateLimiter('1')
+      await acquireRequestSlot(lookupUrl)
+
+      let granted = false
+      void acquireRequestSlot(lookupUrl)!.then(() => {
+        granted = true
+      })
+      await vi.advanceTimersByTimeAsync(900)
+      expect(granted).toBe(false)
+
+      await vi.advanceTimersByTimeAsync(200)
+      expect(granted).toBe(true)
+    } finally {
+      vi.useRealTimers()
+    }
+  })
+
+  it('should not pace anything when the limit is 0', async () => {
+    const { acquireRequestSlot } = await loadRateLimiter('0')
+    expect(acquireRequestSlot(lookupUrl)).toBeUndefined()
+  })
+
+  it('should skip pacing while suspended and resume afterwards', async () => {
+    const { acquireRequestSlot, suspendPacing } = await loadRateLimiter('1')
+    const resumePacing = suspendPacing()
+    for (let i = 0; i < 5; i++) {
+      expect(acquireRequestSlot(lookupUrl)).toBeUndefined()
+    }
+
+    resumePacing()
+    resumePacing() // Resuming twice must not cancel someone else's suspension
+    expect(acquireRequestSlot(lookupUrl)).toBeInstanceOf(Promise)
+  })
+
+  it('should stay suspended until every overlapping suspension ends', async () => {
+    const { acquireRequestSlot, suspendPacing } = await loadRateLimiter('1')
+    const resumePrepare = suspendPacing()
+    const resumeExecute = suspendPacing()
+
+    resumePrepare()
+    expect(acquireRequestSlot(lookupUrl)).toBeUndefined()
+
+    resumeExecute()
+    expect(acquireRequestSlot(lookupUrl)).toBeInstanceOf(Promise)
+  })
+})
@@ -0,0 +1,74 @@
+import { describe, it, expect } from 'vitest'
+import { getReservationBody, getReservationBodyTemplate, type ApiClientConfig } from '../api'
+import { CookieManager } from '../auth'
+import { VENUES, type ReservationFormData } from '../types'
+
+/**
+ * Tests for the pre-encoded CreateReservation body
+ *
+ * The body is encoded once per form and the court ID spliced in per
+ * attempt. Booking params follow the form's hidden fields, and a CourtId
+ * field the form already has keeps its position.
+ */
+
+const config: ApiClientConfig = { venue: VENUES.sunnyvale, cookieManager: new CookieManager() }
+
+function makeFormData(extra: Record<string, string> = {}): ReservationFormData {
+  return {
+    __RequestVerificationToken: 'CfDJ8N+abc/def==',
+    Id: '13233',
+    OrgId: '13233',
+    Date: '01/14/2026',
+    MemberIds: "O'Brien & Smith",
+    ...extra,
+  }
+}
+
+const FORM_FIELDS =
+  '__RequestVerificationToken=CfDJ8N%2Babc%2Fdef%3D%3D&Id=13233&OrgId=13233&Date=01%2F14%2F2026' +
+  '&MemberIds=O%27Brien+%26+Smith'
+
+describe('Reservation body splicing', () => {
+  it('should splice each court into the same encoded body', () => {
+    const template = getReservationBodyTemplate(config, makeFormData(), '18:30', 90)
+    const bodyFor = (courtId: number) =>
+      `${FORM_FIELDS}&ReservationTypeId=69707&Duration=90&CourtId=${courtId}` +
+      '&StartTime=18%3A30%3A00&EndTime=8%3A00+PM&DisclosureAgree=true'
+
+    expect(getReservationBody(template, 52667)).toBe(bodyFor(52667))
+    expect(getReservationBody(template, 52668)).toBe(bodyFor(52668))
+  })
+
+  it('should keep the form position of a CourtId field the form already has', () => {
+    const formData = makeFormData({ CourtId: '', Notes: 'café court' })
+    const template = getReservationBodyTemplate(config, formData, '11:30', 60)
+
+    expect(getReservationBody(template, 7)).toBe(
+      `${FORM_FIELDS}&CourtId=7&Notes=caf%C3%A9+court&ReservationTypeId=69707&Duration=60` +
+        '&StartTime=11%3A30%3A00&EndTime=12%3A30+PM&DisclosureAgree=true'
+    )
+  })
+
+  it('should rebuild the body when switching back to an earlier court', () => {
+    const template = getReservationBodyTemplate(config, makeFormData(), '23:30', 120)
+
+    const first = getReservationBody(template, 1)
+    const second = getReservationBody(template, 2)
+
+    expect(getReservationBody(template, 1)).toBe(first)
+    expect(first).toContain('&CourtId=1&')
+    expect(second).toContain('&CourtId=2&')
+    expect(first).toContain('&EndTime=1%3A30+AM&')
+  })
+
+  it('should re-encode when the same form is reused for a different slot', () => {
+    const formData = makeFormData()
+    getReservationBodyTemplate(config, formData, '18:30', 90)
+    const template = getReservationBodyTemplate(config, formData, '19:00', 60)
+
+    expect(getReservationBody(template, 52667)).toBe(
+      `${FORM_FIELDS}&ReservationTypeId=69707&Duration=60&CourtId=52667` +
+        '&StartTime=19%3A00%3A00&EndTime=8%3A00+PM&DisclosureAgree=true'
+    )
+  })
+})
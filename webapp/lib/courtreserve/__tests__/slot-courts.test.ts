@@ -0,0 +1,105 @@
+import { describe, it, expect } from 'vitest'
+import { buildSlotCourtsMap, findCourtsForSlot, type ConsolidatedSlot } from '../api'
+
+/**
+ * Tests for the bitmask court lookup used to match availability to slots
+ *
+ * A booking needs a court free in every half-hour it spans. Courts keep the
+ * order of the starting half-hour, and venues can have more than 32 courts,
+ * which spills bit positions into a second mask word.
+ */
+
+const WINTER_DATE = new Date('2026-01-14T12:00:00Z') // PST, UTC-8
+const SUMMER_DATE = new Date('2026-07-15T12:00:00Z') // PDT, UTC-7
+const SPRING_FORWARD_DATE = new Date('2026-03-08T12:00:00Z') // Switches to PDT at 2 AM
+
+// Slot IDs carry UTC times, e.g. "Pickleball01/14/2026 02:30:00" is 18:30 PST
+function slotId(utcTime: string): string {
+  return `Pickleball01/14/2026 ${utcTime}:00`
+}
+
+function ids(courts: Array<{ id: number }>): number[] {
+  return courts.map((court) => court.id)
+}
+
+describe('findCourtsForSlot', () => {
+  // 41 courts: 1000-1039 get bits 0-39 from the 18:00 list, 1040 first appears at 18:30 (bit 40)
+  const allCourts = Array.from({ length: 40 }, (_, i) => 1000 + i)
+  const slots: ConsolidatedSlot[] = [
+    { Id: slotId('02:00'), AvailableCourtIds: allCourts }, // 18:00 PST
+    { Id: slotId('02:30'), AvailableCourtIds: [1039, 1035, 1033, 1008, 1000, 1040] }, // 18:30
+    { Id: slotId('03:00'), AvailableCourtIds: [1040, 1035, 1000, 1033, 1020] }, // 19:00
+    { Id: slotId('03:30'), AvailableCourtIds: [1035] }, // 19:30
+    { Id: slotId('04:00'), AvailableCourtIds: [] }, // 20:00
+  ]
+  const slotCourts = buildSlotCourtsMap(slots, WINTER_DATE)
+
+  it('should return every court free at the start for a 30-minute booking', () => {
+    expect(ids(findCourtsForSlot(slotCourts, 18 * 60, 30))).toEqual(allCourts)
+  })
+
+  it.each([
+    [60, [1000, 1008, 1033, 1035, 1039]],
+    [90, [1000, 1033, 1035]],
+    [120, [1035]],
+  ])('should keep only courts free for all %i minutes, in starting-slot order', (duration, expected) => {
+    expect(ids(findCourtsForSlot(slotCourts, 18 * 60, duration))).toEqual(expected)
+  })
+
+  it('should match courts on either side of the 32-bit word boundary', () => {
+    expect(ids(findCourtsForSlot(slotCourts, 18 * 60 + 30, 60))).toEqual([1035, 1033, 1000, 1040])
+  })
+
+  it('should return no courts when any half-hour is empty or missing', () => {
+    expect(findCourtsForSlot(slotCourts, 19 * 60 + 30, 60)).toEqual([])
+    expect(findCourtsForSlot(slotCourts, 20 * 60, 30)).toEqual([])
+    expect(findCourtsForSlot(slotCourts, 17 * 60 + 30, 60)).toEqual([])
+  })
+
+  it('should not confuse courts 32 bit positions apart', () => {
+    // 41 distinct courts, so the last one lands on bit 40 (word 1, same low bits as bit 8)
+    const courtIds = Array.from({ length: 41 }, (_, i) => 90000 + i)
+    const bit8 = courtIds[8]
+    const bit40 = courtIds[40]
+    const boundarySlots = buildSlotCourtsMap(
+      [
+        { Id: slotId('08:00'), AvailableCourtIds: courtIds }, // 00:00 PST
+        { Id: slotId('02:00'), AvailableCourtIds: [bit40, bit8] }, // 18:00
+        { Id: slotId('02:30'), AvailableCourtIds: [bit8] }, // 18:30
+        { Id: slotId('03:00'), AvailableCourtIds: [bit40] }, // 19:00
+      ],
+      WINTER_DATE
+    )
+
+    expect(ids(findCourtsForSlot(boundarySlots, 18 * 60, 30))).toEqual([bit40, bit8])
+    expect(ids(findCourtsForSlot(boundarySlots, 18 * 60, 60))).toEqual([bit8])
+    expect(findCourtsForSlot(boundarySlots, 18 * 60, 90)).toEqual([])
+    expect(findCourtsForSlot(boundarySlots, 18 * 60 + 30, 60)).toEqual([])
+  })
+
+  it('should wrap past midnight and keep the starting slot order', () => {
+    const wrapSlots = buildSlotCourtsMap(
+      [
+        { Id: slotId('07:30'), AvailableCourtIds: [3, 1, 2] }, // 23:30 PST
+        { Id: slotId('08:00'), AvailableCourtIds: [2, 3] }, // 00:00
+      ],
+      WINTER_DATE
+    )
+
+    expect(findCourtsForSlot(wrapSlots, 23 * 60 + 30, 60)).toEqual([
+      { id: 3, name: 'Court 3' },
+      { id: 2, name: 'Court 2' },
+    ])
+  })
+
+  it.each([
+    ['standard time', WINTER_DATE, 18 * 60],
+    ['daylight time', SUMMER_DATE, 19 * 60],
+    ['the spring-forward day', SPRING_FORWARD_DATE, 19 * 60],
+  ])('should convert UTC slot times using the offset in effect on %s', (_label, date, pacificMinutes) => {
+    const converted = buildSlotCourtsMap([{ Id: slotId('02:00'), AvailableCourtIds: [7] }], date)
+
+    expect(ids(findCourtsForSlot(converted, pacificMinutes, 30))).toEqual([7])
+    expect(converted.slots.size).toBe(1)
+  })
+})
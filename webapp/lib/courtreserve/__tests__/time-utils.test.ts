@@ -0,0 +1,62 @@
+import { describe, it, expect } from 'vitest'
+import { calculateEndTime, formatDate } from '../time-utils'
+
+/**
+ * Tests for the CourtReserve time formatting helpers
+ *
+ * End times are sent as "H:MM AM/PM" and dates as "MM/DD/YYYY"; the edge
+ * cases are the 12 o'clock hours and calendar days that don't have 24 hours.
+ */
+
+describe('Time Utils', () => {
+  describe('calculateEndTime', () => {
+    it.each([
+      ['09:00', 30, '9:30 AM'],
+      ['11:00', 30, '11:30 AM'],
+      ['11:30', 30, '12:00 PM'],
+      ['11:00', 60, '12:00 PM'],
+      ['11:30', 90, '1:00 PM'],
+      ['10:30', 120, '12:30 PM'],
+      ['12:00', 60, '1:00 PM'],
+      ['12:30', 30, '1:00 PM'],
+    ])('should cross noon: %s + %i min = %s', (start, duration, expected) => {
+      expect(calculateEndTime(start, duration)).toBe(expected)
+    })
+
+    it.each([
+      ['23:30', 30, '12:00 AM'],
+      ['23:00', 60, '12:00 AM'],
+      ['23:00', 90, '12:30 AM'],
+      ['22:30', 120, '12:30 AM'],
+      ['23:30', 120, '1:30 AM'],
+      ['00:00', 30, '12:30 AM'],
+      ['00:30', 60, '1:30 AM'],
+    ])('should cross midnight: %s + %i min = %s', (start, duration, expected) => {
+      expect(calculateEndTime(start, duration)).toBe(expected)
+    })
+
+    it('should keep single-digit hours unpadded and minutes padded', () => {
+      expect(calculateEndTime('07:05', 60)).toBe('8:05 AM')
+      expect(calculateEndTime('19:00', 120)).toBe('9:00 PM')
+    })
+  })
+
+  describe('formatDate', () => {
+    it.each([
+      ['2026-03-08', '03/08/2026'], // US spring forward
+      ['2026-11-01', '11/01/2026'], // US fall back
+      ['2026-03-29', '03/29/2026'], // EU spring forward
+      ['2026-10-25', '10/25/2026'], // EU fall back
+      ['2025-12-31', '12/31/2025'],
+      ['2026-01-01', '01/01/2026'],
+      ['2028-02-29', '02/29/2028'],
+    ])('should rearrange %s without shifting the day', (date, expected) => {
+      expect(formatDate(date)).toBe(expected)
+    })
+
+    it('should format Date objects late on daylight saving change days', () => {
+      expect(formatDate(new Date(2026, 2, 8, 23, 30))).toBe('03/08/2026')
+      expect(formatDate(new Date(2026, 10, 1, 23, 30))).toBe('11/01/2026')
+    })
+  })
+})
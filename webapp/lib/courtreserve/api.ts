@@ -15,26 +15,49 @@ import {
   USER_AGENT,
   VenueConfig,
 } from './types';
-import {
-  addSeconds,
-  calculateEndTime,
-  formatDate,
-  formatDateMidnight,
-  formatDateTime,
-  to12HourWithSeconds,
-} from './time-utils';
+import { formatDate, getSlotFormats } from './time-utils';
 import { CookieManager } from './auth';
-import { createLogger } from '../logger';
+import { httpAgent } from './http-pool';
+import { acquireRequestSlot } from './rate-limiter';
+import { createLogger, LogLevel } from '../logger';
 import { decodeHTML } from 'entities';
-import * as cheerio from 'cheerio';
+// undici's own fetch, so requests go through the same undici version as httpAgent (Node's
+// built-in fetch bundles a different major, whose dispatcher API doesn't match)
+import { fetch, Headers, type RequestInit, type Response } from 'undici';
 
 const log = createLogger('CourtReserve:API');
 
+// Form scraping patterns (compiled once at module load)
+const INPUT_TAG_RE = /<input\b[^>]*>/gi;
+const TAG_ATTR_RE = /([\w:.-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))/g;
+const HIDDEN_HINT_RE = /hidden/i;
+const FIX_URL_PREFIX = "fixUrl('"; // Wrapper JS loads the form via url: fixUrl('...CreateReservation...')
+const FORM_API_URL_MARKER = 'CreateReservation';
+
+// Error modal scraping (only used when the form has no CSRF token)
+const ERROR_BODY_RE = /error-inner[^>]*>([\s\S]*?)<\/div>/i;
+const ERROR_CONTAINER_RE = /outer-inner-container[^>]*>([\s\S]*?)<\/div>\s*<\/div>\s*<\/div>/i;
+const HTML_TAG_RE = /<[^>]+>/g;
+const WHITESPACE_RUN_RE = /\s+/g;
+
+let requestCounter = 0; // Request IDs only tag log lines, so a counter does not need to be random
+
+// ReadConsolidated slot IDs end in a UTC time, e.g. "Pickleball01/14/2026 15:00:00"
+const SLOT_TIME_RE = /(\d{1,2}):(\d{2}):(\d{2})/;
+
 export interface ApiClientConfig {
   venue: VenueConfig;
   cookieManager: CookieManager;
 }
 
+/**
+ * Read and discard a response body so its socket goes back to the keep-alive pool
+ * An unread body pins the connection, forcing the next request (often a retry) onto a new handshake
+ */
+async function discardBody(response: Response): Promise<void> {
+  await response.text().catch(() => undefined);
+}
+
 /**
  * Fetch with cookie management, logging, and timeout
  */
@@ -45,10 +68,13 @@ async function fetchWithCookies(
   depth: number = 0,
   timeoutMs: number = 30000 // 30 second default timeout
 ): Promise<Response> {
-  const requestId = Math.random().toString(36).substring(7);
+  const requestId = (++requestCounter).toString(36);
   const method = options.method || 'GET';
+  const debugEnabled = log.isLevelEnabled(LogLevel.DEBUG); // Skip building log args on every request
 
-  log.trace(`[${requestId}] Starting request`, { method, url, depth, timeoutMs });
+  if (log.isLevelEnabled(LogLevel.TRACE)) {
+    log.trace(`[${requestId}] Starting request`, { method, url, depth, timeoutMs });
+  }
 
   const headers = new Headers(options.headers);
 
@@ -56,50 +82,53 @@ async function fetchWithCookies(
   headers.set('User-Agent', USER_AGENT);
 
   // Attach cookies
-  const cookieCount = cookieManager.getAllCookies().length;
   if (cookieManager.hasCookies()) {
     const cookieString = cookieManager.serializeCookies();
     headers.set('Cookie', cookieString);
-    log.trace(`[${requestId}] Attaching ${cookieCount} cookies`, {
-      cookiePreview: cookieString.substring(0, 100) + '...',
-    });
+    if (log.isLevelEnabled(LogLevel.TRACE)) {
+      log.trace(`[${requestId}] Attaching ${cookieManager.getAllCookies().length} cookies`, {
+        cookiePreview: cookieString.substring(0, 100) + '...',
+      });
+    }
   } else {
     log.trace(`[${requestId}] No cookies to attach`);
   }
 
-  const startTime = Date.now();
+  // Pace lookups per host (redirect hops were already paced by the original request)
+  if (depth === 0) {
+    const slot = acquireRequestSlot(url);
+    if (slot) {
+      await slot;
+    }
+  }
 
-  // Create AbortController for timeout
-  const controller = new AbortController();
-  const timeoutId = setTimeout(() => {
-    controller.abort();
-    log.warn(`[${requestId}] Request timeout after ${timeoutMs}ms`, { url, method });
-  }, timeoutMs);
+  const startTime = Date.now();
 
   try {
     const response = await fetch(url, {
       ...options,
       headers,
       redirect: 'manual', // Handle redirects manually to capture cookies
-      signal: controller.signal,
+      signal: AbortSignal.timeout(timeoutMs), // Unref'd timer; also bounds reading the body
+      dispatcher: httpAgent, // Reuse pooled keep-alive connections
     });
 
-    clearTimeout(timeoutId);
-
-    const elapsed = Date.now() - startTime;
-    log.debug(`[${requestId}] Response received`, {
-      status: response.status,
-      statusText: response.statusText,
-      elapsed: `${elapsed}ms`,
-    });
+    if (debugEnabled) {
+      log.debug(`[${requestId}] Response received`, {
+        status: response.status,
+        statusText: response.statusText,
+        elapsed: `${Date.now() - startTime}ms`,
+      });
+    }
 
-    // Handle redirects
-    if (response.status >= 300 && response.status < 400) {
+    // Handle redirects (callers passing redirect: 'manual' get the 3xx response as-is)
+    if (response.status >= 300 && response.status < 400 && options.redirect !== 'manual') {
       const location = response.headers.get('Location');
       if (location) {
         log.debug(`[${requestId}] Following redirect to: ${location}`);
         // Store cookies from redirect
         cookieManager.parseSetCookies(response.headers);
+        await discardBody(response);
         // Follow redirect (with depth limit)
         if (depth > 5) {
           throw new Error('Too many redirects');
@@ -108,20 +137,18 @@ async function fetchWithCookies(
       }
     }
 
-    // Store cookies from response
-    const setCookieHeaders = response.headers.getSetCookie();
-    if (setCookieHeaders.length > 0) {
-      log.trace(`[${requestId}] Received ${setCookieHeaders.length} Set-Cookie headers`);
+    // Store cookies from response (most responses set none, so skip splitting the header list)
+    if (response.headers.has('Set-Cookie')) {
+      log.trace(`[${requestId}] Received Set-Cookie headers`);
       cookieManager.parseSetCookies(response.headers);
     }
 
     return response;
   } catch (error) {
-    clearTimeout(timeoutId);
     const elapsed = Date.now() - startTime;
 
     // Better error message for timeout
-    const isTimeout = error instanceof Error && error.name === 'AbortError';
+    const isTimeout = error instanceof Error && (error.name === 'TimeoutError' || error.name === 'AbortError');
     const errorMessage = isTimeout
       ? `Request timeout after ${timeoutMs}ms`
       : error instanceof Error
@@ -147,8 +174,11 @@ export async function initializeSession(config: ApiClientConfig): Promise<void>
   const url = `${API_DOMAINS.main}/Online/Account/LogIn/${config.venue.orgId}`;
   log.debug('Fetching login page to establish session', { url });
 
+  // Only the session cookies matter here, and they arrive on the first response,
+  // so don't follow redirects
   const startTime = Date.now();
-  await fetchWithCookies(url, config.cookieManager);
+  const response = await fetchWithCookies(url, config.cookieManager, { redirect: 'manual' });
+  await discardBody(response);
   const elapsed = Date.now() - startTime;
 
   const cookieCount = config.cookieManager.getAllCookies().length;
@@ -156,13 +186,26 @@ export async function initializeSession(config: ApiClientConfig): Promise<void>
   log.trace('Session cookies', { cookies: config.cookieManager.getAllCookies().map((c) => c.name) });
 }
 
+/**
+ * Serialize the login request body
+ * Built once per client and reused for every login retry and re-authentication
+ */
+export function buildLoginBody(email: string, password: string): string {
+  return JSON.stringify({
+    IsApiCall: true,
+    UserNameOrEmail: email,
+    Password: password,
+  });
+}
+
 /**
  * Login to CourtReserve
+ * @param loginBody - Pre-serialized body from buildLoginBody()
  */
 export async function login(
   config: ApiClientConfig,
   email: string,
-  password: string
+  loginBody: string
 ): Promise<LoginResponse> {
   log.info('Attempting login', { email, venue: config.venue.name });
 
@@ -184,21 +227,18 @@ export async function login(
       Referer: `${API_DOMAINS.main}/Online/Account/LogIn/${config.venue.orgId}`,
       reactsubmit: 'true',
     },
-    body: JSON.stringify({
-      IsApiCall: true,
-      UserNameOrEmail: email,
-      Password: password,
-    }),
+    body: loginBody,
   });
 
   const elapsed = Date.now() - startTime;
 
   if (!response.ok) {
     log.error('Login HTTP error', { status: response.status, statusText: response.statusText });
+    await discardBody(response);
     throw new Error(`Login failed: ${response.status} ${response.statusText}`);
   }
 
-  const data: LoginResponse = await response.json();
+  const data = (await response.json()) as LoginResponse;
   log.debug('Login response', { isValid: data.IsValid, elapsed: `${elapsed}ms` });
 
   if (data.IsValid) {
@@ -210,6 +250,45 @@ export async function login(
   return data;
 }
 
+interface VenueUrls {
+  durations: string;
+  wrapper: string;
+  createReservation: string;
+}
+
+// Venue configs are static, so the fixed part of each query string is built once
+const venueUrlCache = new WeakMap<VenueConfig, VenueUrls>();
+
+/**
+ * Get the per-venue URL prefixes; callers append only the date/time params
+ */
+function getVenueUrls(venue: VenueConfig): VenueUrls {
+  let urls = venueUrlCache.get(venue);
+  if (!urls) {
+    const durationParams = new URLSearchParams({
+      id: venue.orgId,
+      reservationTypeId: venue.reservationTypeId,
+      uiCulture: UI_CULTURE,
+      useMinTimeAsDefault: 'False',
+      courtId: '',
+      courtType: venue.courtType.toString(),
+      isDynamicSlot: 'False',
+      customSchedulerId: venue.schedulerId,
+    });
+    const wrapperParams = new URLSearchParams({
+      courtType: 'Pickleball',
+      customSchedulerId: venue.schedulerId,
+    });
+    urls = {
+      durations: `${API_DOMAINS.api}/api/v1/portalreservationsapi/GetDurationDropdown?${durationParams}`,
+      wrapper: `${API_DOMAINS.main}/Online/Reservations/CreateReservation/${venue.orgId}?${wrapperParams}`,
+      createReservation: `${API_DOMAINS.reservations}/Online/ReservationsApi/CreateReservation/${venue.orgId}?uiCulture=${UI_CULTURE}`,
+    };
+    venueUrlCache.set(venue, urls);
+  }
+  return urls;
+}
+
 /**
  * Get available durations for a time slot
  */
@@ -219,26 +298,13 @@ export async function getAvailableDurations(
   startTime: string
 ): Promise<DurationOption[]> {
   const formattedDate = formatDate(date);
-  const displayTime = to12HourWithSeconds(startTime);
-  const endTime = calculateEndTime(startTime, 120);
+  const { startDisplay: displayTime, endTime12: endTime } = getSlotFormats(startTime, 120);
 
   log.debug('Getting available durations', { date: formattedDate, startTime, displayTime });
 
-  const params = new URLSearchParams({
-    id: config.venue.orgId,
-    reservationTypeId: config.venue.reservationTypeId,
-    startTime: displayTime,
-    selectedDate: formattedDate,
-    uiCulture: UI_CULTURE,
-    useMinTimeAsDefault: 'False',
-    courtId: '',
-    courtType: config.venue.courtType.toString(),
-    endTime: endTime,
-    isDynamicSlot: 'False',
-    customSchedulerId: config.venue.schedulerId,
-  });
-
-  const url = `${API_DOMAINS.api}/api/v1/portalreservationsapi/GetDurationDropdown?${params}`;
+  const url =
+    `${getVenueUrls(config.venue).durations}&startTime=${encodeFormComponent(displayTime)}` +
+    `&selectedDate=${encodeFormComponent(formattedDate)}&endTime=${encodeFormComponent(endTime)}`;
   log.trace('Duration dropdown URL', { url });
 
   const startTimeMs = Date.now();
@@ -247,10 +313,11 @@ export async function getAvailableDurations(
 
   if (!response.ok) {
     log.error('Get durations failed', { status: response.status });
+    await discardBody(response);
     throw new Error(`Get durations failed: ${response.status}`);
   }
 
-  const data: DurationOption[] = await response.json();
+  const data = (await response.json()) as DurationOption[];
   const availableDurations = data.filter((d) => !d.disabled).map((d) => d.value);
 
   log.debug('Available durations retrieved', {
@@ -281,6 +348,161 @@ export async function getAvailableCourts(
     venue: config.venue.name,
   });
 
+  const startTimeMs = Date.now();
+  const slotsMap = await getSlotCourts(config, dateObj);
+  const elapsed = Date.now() - startTimeMs;
+
+  // Extract courts available at the requested time
+  const courts = findCourtsForSlot(slotsMap, toMinutesOfDay(startTime), duration);
+
+  log.info('Available courts retrieved', {
+    count: courts.length,
+    courts: courts.map((c) => ({ id: c.id, name: c.name })),
+    elapsed: `${elapsed}ms`,
+  });
+
+  if (courts.length === 0) {
+    log.debug('No courts available for this time slot');
+  }
+
+  return courts;
+}
+
+/**
+ * Get available courts for every slot/duration combination of a date at once
+ * ReadConsolidated covers the whole day, so this is one request and one parse
+ * @returns Map keyed by "HH:MM-duration", in priority order (durations, then slots)
+ */
+export async function getCourtAvailability(
+  config: ApiClientConfig,
+  date: Date | string,
+  timeSlots: string[],
+  durations: number[]
+): Promise<Map<string, Court[]>> {
+  const dateObj = typeof date === 'string' ? new Date(date) : date;
+
+  log.debug('Getting court availability via ReadConsolidated', {
+    date: dateObj.toISOString(),
+    timeSlots,
+    durations,
+    venue: config.venue.name,
+  });
+
+  const startTimeMs = Date.now();
+  const slotsMap = await getSlotCourts(config, dateObj);
+  const elapsed = Date.now() - startTimeMs;
+
+  // Parse each slot time once rather than once per duration
+  const slotMinutes = timeSlots.map(toMinutesOfDay);
+
+  const availability = new Map<string, Court[]>();
+  let combinationsWithCourts = 0;
+  for (const duration of durations) {
+    for (let i = 0; i < timeSlots.length; i++) {
+      const courts = findCourtsForSlot(slotsMap, slotMinutes[i], duration);
+      if (courts.length > 0) combinationsWithCourts++;
+      availability.set(`${timeSlots[i]}-${duration}`, courts);
+    }
+  }
+
+  log.info('Court availability retrieved', {
+    combinations: availability.size,
+    combinationsWithCourts,
+    elapsed: `${elapsed}ms`,
+  });
+
+  return availability;
+}
+
+export type ConsolidatedSlot = { Id: string; AvailableCourtIds?: number[] };
+
+interface CachedSlots {
+  fetchedAt: number;
+  slots: Promise<SlotCourts>;
+}
+
+// ReadConsolidated returns the whole day, so every slot/duration lookup for a date can share
+// one response. In-flight requests are shared too, so a burst of lookups costs one POST.
+// Only the parsed slot -> court IDs map is kept; the raw slot objects are dropped after parsing.
+// Availability is per venue, not per account, so whichever session asks first fetches it for
+// every account. A successful booking drops the cache, since it just took a court.
+const AVAILABILITY_CACHE_TTL_MS = 2000;
+const MAX_CACHED_AVAILABILITY = 64;
+const availabilityCache = new Map<string, CachedSlots>(); // key: ReadConsolidated form body
+
+/**
+ * Get the available courts per Pacific time slot for a date, reusing a recent or in-flight response
+ */
+function getSlotCourts(config: ApiClientConfig, dateObj: Date): Promise<SlotCourts> {
+  const { url, formBody, headers } = getReadConsolidatedRequest(config.venue, dateObj);
+
+  const cached = availabilityCache.get(formBody);
+  if (cached && Date.now() - cached.fetchedAt < AVAILABILITY_CACHE_TTL_MS) {
+    log.trace('ReadConsolidated cache hit', { url });
+    return cached.slots;
+  }
+
+  log.trace('ReadConsolidated request', { url, formBody });
+
+  const slots = (async () => {
+    const response = await fetchWithCookies(url, config.cookieManager, {
+      method: 'POST',
+      headers,
+      body: formBody,
+    });
+
+    if (!response.ok) {
+      log.error('ReadConsolidated failed', { status: response.status });
+      await discardBody(response);
+      throw new Error(`ReadConsolidated failed: ${response.status}`);
+    }
+
+    const result = (await response.json()) as { Data?: ConsolidatedSlot[] };
+    return buildSlotCourtsMap(result.Data || [], dateObj);
+  })();
+
+  const entry: CachedSlots = { fetchedAt: Date.now(), slots };
+  if (availabilityCache.size >= MAX_CACHED_AVAILABILITY) {
+    availabilityCache.clear();
+  }
+  availabilityCache.set(formBody, entry);
+
+  // TTL counts from when the response arrived; failures are dropped so the next lookup retries
+  slots.then(
+    () => {
+      entry.fetchedAt = Date.now();
+    },
+    () => {
+      if (availabilityCache.get(formBody) === entry) {
+        availabilityCache.delete(formBody);
+      }
+    }
+  );
+
+  return slots;
+}
+
+interface ReadConsolidatedRequest {
+  url: string;
+  formBody: string;
+  headers: Record<string, string>; // Copied by fetchWithCookies, so safe to share between requests
+}
+
+// The request only depends on venue + date, so every slot/duration lookup for a day reuses it
+// (URL, serialized body and headers are built once; a poll just replays them)
+const readConsolidatedRequestCache = new Map<string, ReadConsolidatedRequest>();
+const MAX_CACHED_REQUESTS = 64; // A handful of dates per day; reset rather than grow forever
+
+/**
+ * Build (or reuse) the ReadConsolidated URL and form body for a venue/date
+ */
+function getReadConsolidatedRequest(venue: VenueConfig, dateObj: Date): ReadConsolidatedRequest {
+  const key = `${venue.orgId}-${venue.schedulerId}-${dateObj.toISOString()}`;
+  let request = readConsolidatedRequestCache.get(key);
+  if (request) {
+    return request;
+  }
+
   // Build startDate in UTC format
   // IMPORTANT: Use UTC methods because date strings like "2026-01-21" are parsed as UTC midnight,
   // which becomes the previous day when converted to local time (e.g., PST)
@@ -296,76 +518,74 @@ export async function getAvailableCourts(
 
   const jsonData = {
     startDate: startDateUtc,
-    orgId: config.venue.orgId,
+    orgId: venue.orgId,
     TimeZone: 'America/Los_Angeles',
     Date: dateStr,
     KendoDate: { Year: year, Month: month + 1, Day: day },
     UiCulture: 'en-US',
-    CostTypeId: config.venue.costTypeId,
-    CustomSchedulerId: config.venue.schedulerId,
-    ReservationMinInterval: config.venue.reservationMinInterval,
+    CostTypeId: venue.costTypeId,
+    CustomSchedulerId: venue.schedulerId,
+    ReservationMinInterval: venue.reservationMinInterval,
   };
 
   const formBody = `sort=&group=&filter=&jsonData=${encodeURIComponent(JSON.stringify(jsonData))}`;
-  const url = `${API_DOMAINS.main}/Online/Reservations/ReadConsolidated/${config.venue.orgId}`;
+  const url = `${API_DOMAINS.main}/Online/Reservations/ReadConsolidated/${venue.orgId}`;
+  const referer = `${API_DOMAINS.main}/Online/Reservations/Bookings/${venue.orgId}?sId=${venue.schedulerId}`;
 
-  log.trace('ReadConsolidated request', { url, jsonData });
-
-  const startTimeMs = Date.now();
-  const response = await fetchWithCookies(url, config.cookieManager, {
-    method: 'POST',
-    headers: {
-      'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-      'X-Requested-With': 'XMLHttpRequest',
-      Referer: `${API_DOMAINS.main}/Online/Reservations/Bookings/${config.venue.orgId}?sId=${config.venue.schedulerId}`,
-    },
-    body: formBody,
-  });
-
-  const elapsed = Date.now() - startTimeMs;
+  const headers = {
+    'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+    'X-Requested-With': 'XMLHttpRequest',
+    Referer: referer,
+  };
 
-  if (!response.ok) {
-    log.error('ReadConsolidated failed', { status: response.status });
-    throw new Error(`ReadConsolidated failed: ${response.status}`);
+  request = { url, formBody, headers };
+  if (readConsolidatedRequestCache.size >= MAX_CACHED_REQUESTS) {
+    readConsolidatedRequestCache.clear();
   }
+  readConsolidatedRequestCache.set(key, request);
+  return request;
+}
 
-  const result = await response.json();
-  const slots = result.Data || [];
-
-  // Parse response: extract courts available at the requested time
-  const courts = parseConsolidatedSlots(slots, startTime, duration, dateObj);
-
-  log.info('Available courts retrieved', {
-    count: courts.length,
-    courts: courts.map((c) => ({ id: c.id, name: c.name })),
-    elapsed: `${elapsed}ms`,
-  });
+const MINUTES_PER_DAY = 24 * 60;
+const PACIFIC_OFFSET_FORMAT = new Intl.DateTimeFormat('en-US', {
+  timeZone: 'America/Los_Angeles',
+  timeZoneName: 'shortOffset',
+}); // Formats the zone as "GMT-8" / "GMT-7"
 
-  if (courts.length === 0) {
-    log.debug('No courts available for this time slot');
-  }
+interface SlotAvailability {
+  courtBits: number[]; // Bit positions of the free courts, in the order ReadConsolidated lists them (booking priority)
+  mask: Uint32Array; // The same courts as a bitmask
+}
 
-  return courts;
+interface SlotCourts {
+  courts: Court[]; // Bit position -> Court, built once per parse and shared by every lookup
+  slots: Map<number, SlotAvailability>; // Pacific minutes since midnight -> courts free then
 }
 
 /**
- * Parse consolidated slots to find available courts for a specific time/duration
+ * Parse consolidated slots into per-slot court lists and bitmasks
+ * Court IDs are large, so each court seen in the response gets a dense bit position instead
  */
-function parseConsolidatedSlots(
-  slots: Array<{ Id: string; AvailableCourtIds?: number[] }>,
-  startTime: string,
-  duration: number,
-  dateObj: Date
-): Court[] {
-  // Build a map of time slot -> available court IDs
-  const slotsMap: Map<string, Set<number>> = new Map();
+export function buildSlotCourtsMap(slots: ConsolidatedSlot[], dateObj: Date): SlotCourts {
+  const courtIndex = new Map<number, number>();
+  const courts: Court[] = [];
+  for (const slot of slots) {
+    for (const courtId of slot.AvailableCourtIds || []) {
+      if (!courtIndex.has(courtId)) {
+        courtIndex.set(courtId, courts.length);
+        courts.push({ id: courtId, name: `Court ${courtId}` });
+      }
+    }
+  }
+  const words = Math.ceil(courtIndex.size / 32);
 
   // Pacific timezone offset (PST=-8, PDT=-7)
-  const utcOffset = isPDT(dateObj) ? -7 : -8;
+  const utcOffset = getPacificUtcOffset(dateObj);
 
+  const slotsMap = new Map<number, SlotAvailability>();
   for (const slot of slots) {
     // Parse time from slot ID (format: "Pickleball01/14/2026 15:00:00")
-    const match = slot.Id?.match(/(\d{1,2}):(\d{2}):(\d{2})/);
+    const match = slot.Id ? SLOT_TIME_RE.exec(slot.Id) : null;
     if (!match) continue;
 
     const utcHour = parseInt(match[1], 10);
@@ -373,71 +593,234 @@ function parseConsolidatedSlots(
 
     // Convert UTC to Pacific time
     const pacificHour = (utcHour + utcOffset + 24) % 24;
-    const slotTime = `${pacificHour.toString().padStart(2, '0')}:${minute.toString().padStart(2, '0')}`;
 
-    const courtIds = slot.AvailableCourtIds || [];
-    slotsMap.set(slotTime, new Set(courtIds));
+    const courtBits: number[] = [];
+    const mask = new Uint32Array(words);
+    for (const courtId of slot.AvailableCourtIds || []) {
+      const bit = courtIndex.get(courtId)!;
+      const bitMask = 1 << (bit & 31);
+      if ((mask[bit >>> 5] & bitMask) === 0) {
+        mask[bit >>> 5] |= bitMask;
+        courtBits.push(bit);
+      }
+    }
+    slotsMap.set(pacificHour * 60 + minute, { courtBits, mask });
   }
 
-  // Find courts available for the entire duration
-  const startDt = parseTime(startTime);
-  const requiredSlots: string[] = [];
+  return { courts, slots: slotsMap };
+}
 
-  for (let offset = 0; offset < duration; offset += 30) {
-    const checkTime = new Date(startDt.getTime() + offset * 60000);
-    const slotStr = `${checkTime.getHours().toString().padStart(2, '0')}:${checkTime.getMinutes().toString().padStart(2, '0')}`;
-    requiredSlots.push(slotStr);
-  }
+/**
+ * Convert "HH:MM" to minutes past midnight
+ */
+function toMinutesOfDay(time: string): number {
+  const [hours, minutes] = time.split(':').map(Number);
+  return hours * 60 + minutes;
+}
 
-  // Find intersection of courts across all required slots
-  let availableCourts: Set<number> | null = null;
+/**
+ * Find courts available for a specific time/duration in a parsed slots map
+ * Courts keep the order of the starting slot; later half-hours only filter them out
+ */
+export function findCourtsForSlot(slotCourts: SlotCourts, startTotalMinutes: number, duration: number): Court[] {
+  const first = slotCourts.slots.get(startTotalMinutes % MINUTES_PER_DAY);
+  if (!first || first.courtBits.length === 0) {
+    return []; // No courts available for this slot
+  }
 
-  for (const slot of requiredSlots) {
-    const slotCourts = slotsMap.get(slot);
-    if (!slotCourts || slotCourts.size === 0) {
+  // AND the masks of the remaining half-hours (wrapping past midnight), one word per 32 courts
+  let remaining: Uint32Array | null = null;
+  for (let offset = 30; offset < duration; offset += 30) {
+    const slot = slotCourts.slots.get((startTotalMinutes + offset) % MINUTES_PER_DAY);
+    if (!slot || slot.courtBits.length === 0) {
       return []; // No courts available for this slot
     }
 
-    if (availableCourts === null) {
-      availableCourts = new Set(slotCourts);
+    if (remaining === null) {
+      remaining = slot.mask.slice();
     } else {
-      // Intersect with previous slots
-      const intersection = new Set<number>();
-      for (const courtId of availableCourts) {
-        if (slotCourts.has(courtId)) {
-          intersection.add(courtId);
-        }
+      for (let word = 0; word < remaining.length; word++) {
+        remaining[word] &= slot.mask[word];
       }
-      availableCourts = intersection;
     }
   }
 
-  // Convert to Court objects
-  return Array.from(availableCourts || []).map((id) => ({ id, name: `Court ${id}` }));
+  const mask = remaining;
+  const courtBits = mask === null
+    ? first.courtBits
+    : first.courtBits.filter((bit) => (mask[bit >>> 5] & (1 << (bit & 31))) !== 0);
+
+  return courtBits.map((bit) => slotCourts.courts[bit]);
+}
+
+/**
+ * Get the Pacific UTC offset in hours (-8 or -7) in effect on a date, per the tz database
+ * Evaluated at Pacific midday, clear of the 2 AM switchover
+ */
+function getPacificUtcOffset(date: Date): number {
+  const midday = Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate(), 20);
+  const zoneName = PACIFIC_OFFSET_FORMAT.formatToParts(midday).find((part) => part.type === 'timeZoneName');
+  return zoneName ? Number(zoneName.value.slice(3)) : -8; // "GMT-7" -> -7
+}
+
+// The CreateReservation form URL only depends on venue/date/start/end, so the wrapper page is
+// fetched once per combination and shared by every account booking it (in-flight included)
+const formApiUrlCache = new Map<string, Promise<string>>();
+const MAX_CACHED_FORM_URLS = 256;
+
+interface FormUrlTemplate {
+  template: string; // Resolved form URL with the start/end values swapped for placeholders
+  encode: (value: string) => string; // How the wrapper encoded start/end into the URL
+}
+
+// Form URLs follow a per-venue pattern, so once one is resolved the next can be guessed and
+// fetched alongside its wrapper page. null = the guess was wrong once, stop guessing.
+const formUrlTemplates = new WeakMap<VenueConfig, FormUrlTemplate | null>();
+const FORM_URL_START = '\u0000start\u0000';
+const FORM_URL_END = '\u0000end\u0000';
+const FORM_URL_ENCODERS = [encodeFormComponent, encodeURIComponent, (value: string) => value];
+
+/**
+ * Remember how a resolved form URL embeds the slot's start/end, if it does
+ */
+function learnFormUrlTemplate(venue: VenueConfig, formApiUrl: string, start: string, end: string): void {
+  if (formUrlTemplates.has(venue)) {
+    return;
+  }
+
+  for (const encode of FORM_URL_ENCODERS) {
+    const encodedStart = encode(start);
+    const encodedEnd = encode(end);
+    if (formApiUrl.includes(encodedStart) && formApiUrl.includes(encodedEnd)) {
+      const template = formApiUrl.replace(encodedStart, FORM_URL_START).replace(encodedEnd, FORM_URL_END);
+      formUrlTemplates.set(venue, { template, encode });
+      log.debug('Learned form API URL pattern', { venue: venue.name });
+      return;
+    }
+  }
+}
+
+/**
+ * Guess the form URL for a slot from the venue's learned pattern
+ */
+function guessFormApiUrl(venue: VenueConfig, start: string, end: string): string | null {
+  const learned = formUrlTemplates.get(venue);
+  if (!learned) {
+    return null;
+  }
+  return learned.template.replace(FORM_URL_START, learned.encode(start)).replace(FORM_URL_END, learned.encode(end));
 }
 
-function parseTime(timeStr: string): Date {
-  const [hours, minutes] = timeStr.split(':').map(Number);
-  const d = new Date();
-  d.setHours(hours, minutes, 0, 0);
-  return d;
+/**
+ * Find the CreateReservation form URL in the wrapper's inline JS
+ * A literal indexOf scan: the wrapper is mostly Kendo script, and only a few fixUrl() calls need checking
+ */
+function extractFormApiUrl(wrapperHtml: string): string | null {
+  let from = 0;
+  for (;;) {
+    const prefixIndex = wrapperHtml.indexOf(FIX_URL_PREFIX, from);
+    if (prefixIndex === -1) {
+      return null;
+    }
+
+    const start = prefixIndex + FIX_URL_PREFIX.length;
+    const end = wrapperHtml.indexOf("'", start);
+    if (end === -1) {
+      return null;
+    }
+
+    // Must be the ajax option (url: fixUrl('...')), not some other fixUrl() call
+    let before = prefixIndex - 1;
+    while (before >= 0 && /\s/.test(wrapperHtml[before])) {
+      before--;
+    }
+    const isUrlOption = before >= 3 && wrapperHtml.startsWith('url:', before - 3);
+
+    const markerIndex = wrapperHtml.indexOf(FORM_API_URL_MARKER, start);
+    if (isUrlOption && markerIndex > start && markerIndex + FORM_API_URL_MARKER.length < end) {
+      return wrapperHtml.slice(start, end);
+    }
+
+    from = end + 1;
+  }
 }
 
-function isPDT(date: Date): boolean {
-  // DST in US: Second Sunday March to First Sunday November
-  const year = date.getFullYear();
-  const march = new Date(year, 2, 1);
-  const nov = new Date(year, 10, 1);
+/**
+ * Resolve the form API URL embedded in the CreateReservation wrapper page
+ */
+function resolveFormApiUrl(config: ApiClientConfig, wrapperUrl: string): Promise<string> {
+  const cached = formApiUrlCache.get(wrapperUrl);
+  if (cached) {
+    log.trace('Form API URL cache hit', { url: wrapperUrl });
+    return cached;
+  }
+
+  log.trace('Fetching form wrapper', { url: wrapperUrl });
+
+  const resolved = (async () => {
+    const wrapperStartTime = Date.now();
+    const wrapperResponse = await fetchWithCookies(wrapperUrl, config.cookieManager, {
+      headers: {
+        'X-Requested-With': 'XMLHttpRequest',
+      },
+    });
+
+    if (!wrapperResponse.ok) {
+      log.error('Fetch form wrapper failed', { status: wrapperResponse.status });
+      await discardBody(wrapperResponse);
+      throw new Error(`Fetch form wrapper failed: ${wrapperResponse.status}`);
+    }
+
+    const wrapperHtml = await wrapperResponse.text();
+    log.trace('Form wrapper received', {
+      length: wrapperHtml.length,
+      elapsed: `${Date.now() - wrapperStartTime}ms`,
+    });
+
+    // Extract API URL from wrapper
+    const rawFormApiUrl = extractFormApiUrl(wrapperHtml);
+    if (!rawFormApiUrl) {
+      log.error('Could not extract form API URL from wrapper');
+      log.trace('Wrapper HTML preview', { html: wrapperHtml.substring(0, 500) });
+      throw new Error('Could not extract form API URL from wrapper');
+    }
+
+    let formApiUrl = decodeEntities(rawFormApiUrl);
+    if (formApiUrl.startsWith('/')) {
+      formApiUrl = `${API_DOMAINS.main}${formApiUrl}`;
+    }
+    return formApiUrl;
+  })();
 
-  // Second Sunday in March
-  const marchSunday = 8 + (7 - march.getDay()) % 7;
-  const dstStart = new Date(year, 2, marchSunday, 2);
+  if (formApiUrlCache.size >= MAX_CACHED_FORM_URLS) {
+    formApiUrlCache.clear();
+  }
+  formApiUrlCache.set(wrapperUrl, resolved);
 
-  // First Sunday in November
-  const novSunday = 1 + (7 - nov.getDay()) % 7;
-  const dstEnd = new Date(year, 10, novSunday, 2);
+  // Failures are evicted so the next attempt fetches the wrapper again
+  resolved.catch(() => {
+    if (formApiUrlCache.get(wrapperUrl) === resolved) {
+      formApiUrlCache.delete(wrapperUrl);
+    }
+  });
 
-  return date >= dstStart && date < dstEnd;
+  return resolved;
+}
+
+/**
+ * Drop a wrapper's cached form URL, but only if it resolved to the URL that just failed
+ * A failed guessed URL must not evict the correct URL the wrapper fetch cached meanwhile
+ */
+function evictFormApiUrl(wrapperUrl: string, formApiUrl: string): void {
+  const cached = formApiUrlCache.get(wrapperUrl);
+  cached?.then(
+    (cachedUrl) => {
+      if (cachedUrl === formApiUrl && formApiUrlCache.get(wrapperUrl) === cached) {
+        formApiUrlCache.delete(wrapperUrl);
+      }
+    },
+    () => undefined // Failed resolutions evict themselves
+  );
 }
 
 /**
@@ -449,62 +832,58 @@ export async function fetchReservationForm(
   startTime: string,
   duration: number
 ): Promise<ReservationFormData> {
-  const endTime12 = calculateEndTime(startTime, duration);
-  const startDateTime = formatDateTime(date, startTime);
-  const endDateTime = `${formatDate(date)} ${endTime12}`;
+  const formattedDate = formatDate(date);
+  const { startDisplay, endTime12 } = getSlotFormats(startTime, duration);
+  const startDateTime = `${formattedDate} ${startDisplay}`;
+  const endDateTime = `${formattedDate} ${endTime12}`;
 
   log.debug('Fetching reservation form', {
-    date: formatDate(date),
+    date: formattedDate,
     startTime,
     duration,
     startDateTime,
     endDateTime,
   });
 
-  const params = new URLSearchParams({
-    start: startDateTime,
-    end: endDateTime,
-    courtType: 'Pickleball',
-    customSchedulerId: config.venue.schedulerId,
-  });
-
   // Step 1: Get wrapper HTML
-  const wrapperUrl = `${API_DOMAINS.main}/Online/Reservations/CreateReservation/${config.venue.orgId}?${params}`;
-  log.trace('Fetching form wrapper', { url: wrapperUrl });
-
-  const wrapperStartTime = Date.now();
-  const wrapperResponse = await fetchWithCookies(wrapperUrl, config.cookieManager, {
-    headers: {
-      'X-Requested-With': 'XMLHttpRequest',
-    },
-  });
-
-  if (!wrapperResponse.ok) {
-    log.error('Fetch form wrapper failed', { status: wrapperResponse.status });
-    throw new Error(`Fetch form wrapper failed: ${wrapperResponse.status}`);
-  }
-
-  const wrapperHtml = await wrapperResponse.text();
-  log.trace('Form wrapper received', {
-    length: wrapperHtml.length,
-    elapsed: `${Date.now() - wrapperStartTime}ms`,
-  });
-
-  // Extract API URL from wrapper
-  const urlMatch = wrapperHtml.match(/url:\s*fixUrl\('([^']+CreateReservation[^']+)'/);
-  if (!urlMatch) {
-    log.error('Could not extract form API URL from wrapper');
-    log.trace('Wrapper HTML preview', { html: wrapperHtml.substring(0, 500) });
-    throw new Error('Could not extract form API URL from wrapper');
-  }
+  const wrapperUrl =
+    `${getVenueUrls(config.venue).wrapper}&start=${encodeFormComponent(startDateTime)}` +
+    `&end=${encodeFormComponent(endDateTime)}`;
+
+  // On a wrapper cache miss, fetch the guessed form in parallel instead of after the wrapper
+  const guessedUrl = formApiUrlCache.has(wrapperUrl)
+    ? null
+    : guessFormApiUrl(config.venue, startDateTime, endDateTime);
+  const guessedForm = guessedUrl ? fetchFormPage(config, guessedUrl, wrapperUrl, formattedDate) : null;
+  guessedForm?.catch(() => undefined); // Only awaited when the guess is confirmed
+
+  const formApiUrl = await resolveFormApiUrl(config, wrapperUrl);
+  log.debug('Extracted form API URL', { url: formApiUrl });
 
-  let formApiUrl = decodeHTML(urlMatch[1]);
-  if (formApiUrl.startsWith('/')) {
-    formApiUrl = `${API_DOMAINS.main}${formApiUrl}`;
+  if (guessedForm) {
+    if (formApiUrl === guessedUrl) {
+      log.trace('Guessed form API URL confirmed');
+      return guessedForm;
+    }
+    log.debug('Guessed form API URL was wrong, no longer guessing', { guessedUrl });
+    formUrlTemplates.set(config.venue, null);
+  } else {
+    learnFormUrlTemplate(config.venue, formApiUrl, startDateTime, endDateTime);
   }
-  log.debug('Extracted form API URL', { url: formApiUrl });
 
   // Step 2: Get actual form HTML
+  return fetchFormPage(config, formApiUrl, wrapperUrl, formattedDate);
+}
+
+/**
+ * Fetch the reservation form page and parse its hidden fields (CSRF token included)
+ */
+async function fetchFormPage(
+  config: ApiClientConfig,
+  formApiUrl: string,
+  wrapperUrl: string,
+  formattedDate: string
+): Promise<ReservationFormData> {
   log.trace('Fetching actual form');
   const formStartTime = Date.now();
   const formResponse = await fetchWithCookies(formApiUrl, config.cookieManager, {
@@ -515,6 +894,8 @@ export async function fetchReservationForm(
 
   if (!formResponse.ok) {
     log.error('Fetch form failed', { status: formResponse.status });
+    await discardBody(formResponse);
+    evictFormApiUrl(wrapperUrl, formApiUrl); // Re-resolve from the wrapper next time
     throw new Error(`Fetch form failed: ${formResponse.status}`);
   }
 
@@ -529,21 +910,13 @@ export async function fetchReservationForm(
     __RequestVerificationToken: '',
     Id: '',
     OrgId: config.venue.orgId,
-    Date: formatDate(date),
+    Date: formattedDate,
   };
 
-  // Extract hidden fields using cheerio
-  const $ = cheerio.load(formHtml);
-  let fieldCount = 0;
-
-  $('input[type="hidden"]').each((_, el) => {
-    const name = $(el).attr('name');
-    const value = $(el).attr('value') || '';
-    if (name) {
-      formData[name] = value;
-      fieldCount++;
-    }
-  });
+  // Extract hidden fields with a regex pass (no DOM construction on the booking path)
+  const hiddenFields = parseHiddenInputs(formHtml);
+  const fieldCount = Object.keys(hiddenFields).length;
+  Object.assign(formData, hiddenFields);
 
   log.debug('Parsed form fields', {
     fieldCount,
@@ -554,17 +927,13 @@ export async function fetchReservationForm(
   if (!formData.__RequestVerificationToken) {
     // Try to extract error message from CourtReserve warning modal
     let errorMessage = 'Could not find CSRF token in form';
-    const errorMatch = formHtml.match(/class="[^"]*error[^"]*"[^>]*>([^<]+)</i) 
-      || formHtml.match(/<span[^>]*>([^<]*warning[^<]*)<\/span>/i)
-      || formHtml.match(/modal-title-span[^>]*>([^<]+)</);
-    
+
     // Try to find the actual error content in the modal body
-    const bodyMatch = formHtml.match(/error-inner[^>]*>([\s\S]*?)<\/div>/i)
-      || formHtml.match(/outer-inner-container[^>]*>([\s\S]*?)<\/div>\s*<\/div>\s*<\/div>/i);
-    
+    const bodyMatch = ERROR_BODY_RE.exec(formHtml) || ERROR_CONTAINER_RE.exec(formHtml);
+
     if (bodyMatch) {
       // Strip HTML tags and clean up whitespace
-      const cleanText = bodyMatch[1].replace(/<[^>]+>/g, ' ').replace(/\s+/g, ' ').trim();
+      const cleanText = bodyMatch[1].replace(HTML_TAG_RE, ' ').replace(WHITESPACE_RUN_RE, ' ').trim();
       if (cleanText.length > 10) {
         errorMessage = `CourtReserve error: ${cleanText.substring(0, 500)}`;
       }
@@ -578,6 +947,172 @@ export async function fetchReservationForm(
   return formData;
 }
 
+/**
+ * Decode HTML entities, skipping the decoder for the common entity-free case
+ */
+function decodeEntities(text: string): string {
+  return text.includes('&') ? decodeHTML(text) : text;
+}
+
+/**
+ * Extract name/value pairs of hidden <input> elements from form HTML
+ * Scans input tags directly instead of building a DOM, since only hidden fields are needed.
+ * exec() loops on the shared regexes avoid matchAll's per-call regex clone and iterator.
+ */
+function parseHiddenInputs(html: string): Record<string, string> {
+  const fields: Record<string, string> = {};
+
+  INPUT_TAG_RE.lastIndex = 0;
+  let tagMatch: RegExpExecArray | null;
+  while ((tagMatch = INPUT_TAG_RE.exec(html)) !== null) {
+    const tag = tagMatch[0];
+
+    // Cheap pre-filter: visible inputs never need their attributes parsed
+    if (!HIDDEN_HINT_RE.test(tag)) continue;
+
+    let type = '';
+    let name = '';
+    let value = '';
+
+    TAG_ATTR_RE.lastIndex = 0;
+    let attr: RegExpExecArray | null;
+    while ((attr = TAG_ATTR_RE.exec(tag)) !== null) {
+      const attrValue = attr[2] ?? attr[3] ?? attr[4] ?? '';
+      switch (attr[1].toLowerCase()) {
+        case 'type':
+          type = attrValue.toLowerCase();
+          break;
+        case 'name':
+          name = attrValue;
+          break;
+        case 'value':
+          value = attrValue;
+          break;
+      }
+    }
+
+    if (type === 'hidden' && name) {
+      fields[decodeEntities(name)] = decodeEntities(value);
+    }
+  }
+
+  return fields;
+}
+
+// Characters application/x-www-form-urlencoded leaves as-is
+const FORM_SAFE_RE = /^[A-Za-z0-9_.*-]*$/;
+// encodeURIComponent leaves these alone (or encodes space as %20) where URLSearchParams wouldn't
+const FORM_FIXUP_RE = /[!'()~]|%20/g;
+
+/**
+ * Encode a value exactly like URLSearchParams does
+ * Ids, flags and durations are already safe and skip encoding entirely
+ */
+export function encodeFormComponent(value: string): string {
+  if (FORM_SAFE_RE.test(value)) {
+    return value;
+  }
+  return encodeURIComponent(value).replace(FORM_FIXUP_RE, (m) =>
+    m === '%20' ? '+' : `%${m.charCodeAt(0).toString(16).toUpperCase()}`
+  );
+}
+
+interface ReservationBodyTemplate {
+  key: string; // Booking params the template was built for
+  head: string; // Encoded body up to and including "CourtId="
+  tail: string; // Encoded body after the court ID
+  fieldCount: number;
+  lastCourtId?: number; // Court of the most recently built full body
+  lastBody?: string;
+}
+
+const CREATE_RESERVATION_HEADERS = {
+  'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+  'X-Requested-With': 'XMLHttpRequest',
+  Referer: `${API_DOMAINS.main}/`,
+}; // Copied by fetchWithCookies, so one object serves every booking POST
+
+// A pre-fetched form is reused for every court (and every window-open retry) of its slot
+const reservationBodyTemplates = new WeakMap<ReservationFormData, ReservationBodyTemplate>();
+
+/**
+ * Get the encoded reservation body for a pre-fetched form, split around the court ID
+ * Field order matches merging the booking params over the form data
+ */
+export function getReservationBodyTemplate(
+  config: ApiClientConfig,
+  formData: ReservationFormData,
+  startTime: string,
+  duration: number
+): ReservationBodyTemplate {
+  const key = `${config.venue.reservationTypeId}-${startTime}-${duration}`;
+  const cached = reservationBodyTemplates.get(formData);
+  if (cached && cached.key === key) {
+    return cached;
+  }
+
+  const { startTime24, endTime12 } = getSlotFormats(startTime, duration);
+  const fields: Record<string, string> = {
+    ...formData,
+    ReservationTypeId: config.venue.reservationTypeId,
+    Duration: duration.toString(),
+    CourtId: '',
+    StartTime: startTime24,
+    EndTime: endTime12,
+    DisclosureAgree: 'true',
+  };
+
+  const head: string[] = [];
+  const tail: string[] = [];
+  let target = head;
+  for (const [name, value] of Object.entries(fields)) {
+    if (name === 'CourtId') {
+      head.push('CourtId=');
+      target = tail;
+      continue;
+    }
+    target.push(`${encodeFormComponent(name)}=${encodeFormComponent(value)}`);
+  }
+
+  const template: ReservationBodyTemplate = {
+    key,
+    head: head.join('&'),
+    tail: tail.length > 0 ? `&${tail.join('&')}` : '',
+    fieldCount: head.length + tail.length,
+  };
+  reservationBodyTemplates.set(formData, template);
+  return template;
+}
+
+/**
+ * Get the full reservation body for a court
+ * The last one is kept, so window-open retries against the same court resend the same string
+ */
+export function getReservationBody(template: ReservationBodyTemplate, courtId: number): string {
+  if (template.lastCourtId !== courtId || template.lastBody === undefined) {
+    template.lastCourtId = courtId;
+    template.lastBody = `${template.head}${courtId}${template.tail}`;
+  }
+  return template.lastBody;
+}
+
+/**
+ * Encode the reservation body for a pre-fetched form ahead of time
+ * Keeps the one-off encoding work off the first booking POST; with a court, its full body is built too
+ */
+export function prepareReservationBody(
+  config: ApiClientConfig,
+  formData: ReservationFormData,
+  startTime: string,
+  duration: number,
+  courtId?: number
+): void {
+  const template = getReservationBodyTemplate(config, formData, startTime, duration);
+  if (courtId !== undefined) {
+    getReservationBody(template, courtId);
+  }
+}
+
 /**
  * Submit a court reservation
  */
@@ -588,9 +1123,11 @@ export async function createReservation(
   duration: number,
   courtId: number
 ): Promise<CreateReservationResponse> {
+  const formattedDate = formatDate(date);
+
   log.info('Creating reservation', {
     venue: config.venue.name,
-    date: formatDate(date),
+    date: formattedDate,
     startTime,
     duration,
     courtId,
@@ -602,47 +1139,30 @@ export async function createReservation(
   const formData = await fetchReservationForm(config, date, startTime, duration);
   log.debug('Form data obtained', { elapsed: `${Date.now() - formStartTime}ms` });
 
-  const endTime12 = calculateEndTime(startTime, duration);
-  const startTime24 = addSeconds(startTime);
-
-  // Merge with booking params
-  const postData = {
-    ...formData,
-    ReservationTypeId: config.venue.reservationTypeId,
-    Duration: duration.toString(),
-    CourtId: courtId.toString(),
-    StartTime: startTime24,
-    EndTime: endTime12,
-    DisclosureAgree: 'true',
-  };
-
-  log.trace('Reservation post data', {
-    courtId,
-    startTime: startTime24,
-    endTime: endTime12,
-    duration,
-    reservationTypeId: config.venue.reservationTypeId,
-    fieldCount: Object.keys(postData).length,
-  });
+  // Merge with booking params (same encoding as the pre-fetched path)
+  const template = getReservationBodyTemplate(config, formData, startTime, duration);
+  const formBody = getReservationBody(template, courtId);
 
-  // Convert to form-urlencoded
-  const formBody = new URLSearchParams();
-  for (const [key, value] of Object.entries(postData)) {
-    formBody.append(key, value);
+  if (log.isLevelEnabled(LogLevel.TRACE)) {
+    const { startTime24, endTime12 } = getSlotFormats(startTime, duration);
+    log.trace('Reservation post data', {
+      courtId,
+      startTime: startTime24,
+      endTime: endTime12,
+      duration,
+      reservationTypeId: config.venue.reservationTypeId,
+      fieldCount: template.fieldCount,
+    });
   }
 
-  const url = `${API_DOMAINS.reservations}/Online/ReservationsApi/CreateReservation/${config.venue.orgId}?uiCulture=${UI_CULTURE}`;
+  const url = getVenueUrls(config.venue).createReservation;
   log.debug('Submitting reservation', { url });
 
   const submitStartTime = Date.now();
   const response = await fetchWithCookies(url, config.cookieManager, {
     method: 'POST',
-    headers: {
-      'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-      'X-Requested-With': 'XMLHttpRequest',
-      Referer: `${API_DOMAINS.main}/`,
-    },
-    body: formBody.toString(),
+    headers: CREATE_RESERVATION_HEADERS,
+    body: formBody,
   });
   const submitElapsed = Date.now() - submitStartTime;
 
@@ -651,21 +1171,25 @@ export async function createReservation(
       status: response.status,
       statusText: response.statusText,
     });
+    await discardBody(response);
     throw new Error(`Create reservation failed: ${response.status}`);
   }
 
-  const data: CreateReservationResponse = await response.json();
+  const data = (await response.json()) as CreateReservationResponse;
 
   // Log full response to debug field names
-  log.debug('CreateReservation API response (full)', {
-    fullResponse: JSON.stringify(data),
-    responseKeys: Object.keys(data),
-  });
+  if (log.isLevelEnabled(LogLevel.DEBUG)) {
+    log.debug('CreateReservation API response (full)', {
+      fullResponse: JSON.stringify(data),
+      responseKeys: Object.keys(data),
+    });
+  }
 
   if (data.isValid) {
+    availabilityCache.clear(); // The booked court is no longer free
     log.info('RESERVATION SUCCESSFUL!', {
       courtId,
-      date: formatDate(date),
+      date: formattedDate,
       startTime,
       duration,
       elapsed: `${submitElapsed}ms`,
@@ -677,7 +1201,7 @@ export async function createReservation(
     log.warn('Reservation failed', {
       message: data.message,
       courtId,
-      date: formatDate(date),
+      date: formattedDate,
       startTime,
       elapsed: `${submitElapsed}ms`,
     });
@@ -699,55 +1223,40 @@ export async function submitReservationWithForm(
   duration: number,
   courtId: number
 ): Promise<CreateReservationResponse> {
+  const formattedDate = formatDate(date);
+
   log.info('Submitting reservation with pre-fetched form', {
     venue: config.venue.name,
-    date: formatDate(date),
+    date: formattedDate,
     startTime,
     duration,
     courtId,
   });
 
-  const endTime12 = calculateEndTime(startTime, duration);
-  const startTime24 = addSeconds(startTime);
-
-  // Merge pre-fetched form data with booking params
-  const postData = {
-    ...preFetchedFormData,
-    ReservationTypeId: config.venue.reservationTypeId,
-    Duration: duration.toString(),
-    CourtId: courtId.toString(),
-    StartTime: startTime24,
-    EndTime: endTime12,
-    DisclosureAgree: 'true',
-  };
-
-  log.trace('Pre-fetched form reservation post data', {
-    courtId,
-    startTime: startTime24,
-    endTime: endTime12,
-    duration,
-    reservationTypeId: config.venue.reservationTypeId,
-    fieldCount: Object.keys(postData).length,
-  });
+  // Everything but the court is fixed per form, so only the court ID is encoded here
+  const template = getReservationBodyTemplate(config, preFetchedFormData, startTime, duration);
+  const formBody = getReservationBody(template, courtId);
 
-  // Convert to form-urlencoded
-  const formBody = new URLSearchParams();
-  for (const [key, value] of Object.entries(postData)) {
-    formBody.append(key, value);
+  if (log.isLevelEnabled(LogLevel.TRACE)) {
+    const { startTime24, endTime12 } = getSlotFormats(startTime, duration);
+    log.trace('Pre-fetched form reservation post data', {
+      courtId,
+      startTime: startTime24,
+      endTime: endTime12,
+      duration,
+      reservationTypeId: config.venue.reservationTypeId,
+      fieldCount: template.fieldCount,
+    });
   }
 
-  const url = `${API_DOMAINS.reservations}/Online/ReservationsApi/CreateReservation/${config.venue.orgId}?uiCulture=${UI_CULTURE}`;
+  const url = getVenueUrls(config.venue).createReservation;
   log.debug('Submitting reservation (fast path)', { url });
 
   const submitStartTime = Date.now();
   const response = await fetchWithCookies(url, config.cookieManager, {
     method: 'POST',
-    headers: {
-      'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-      'X-Requested-With': 'XMLHttpRequest',
-      Referer: `${API_DOMAINS.main}/`,
-    },
-    body: formBody.toString(),
+    headers: CREATE_RESERVATION_HEADERS,
+    body: formBody,
   });
   const submitElapsed = Date.now() - submitStartTime;
 
@@ -756,20 +1265,24 @@ export async function submitReservationWithForm(
       status: response.status,
       statusText: response.statusText,
     });
+    await discardBody(response);
     throw new Error(`Create reservation failed: ${response.status}`);
   }
 
-  const data: CreateReservationResponse = await response.json();
+  const data = (await response.json()) as CreateReservationResponse;
 
-  log.debug('CreateReservation API response (fast path)', {
-    fullResponse: JSON.stringify(data),
-    responseKeys: Object.keys(data),
-  });
+  if (log.isLevelEnabled(LogLevel.DEBUG)) {
+    log.debug('CreateReservation API response (fast path)', {
+      fullResponse: JSON.stringify(data),
+      responseKeys: Object.keys(data),
+    });
+  }
 
   if (data.isValid) {
+    availabilityCache.clear(); // The booked court is no longer free
     log.info('RESERVATION SUCCESSFUL (fast path)!', {
       courtId,
-      date: formatDate(date),
+      date: formattedDate,
       startTime,
       duration,
       elapsed: `${submitElapsed}ms`,
@@ -780,7 +1293,7 @@ export async function submitReservationWithForm(
     log.warn('Reservation failed (fast path)', {
       message: data.message,
       courtId,
-      date: formatDate(date),
+      date: formattedDate,
       startTime,
       elapsed: `${submitElapsed}ms`,
     });
@@ -801,10 +1314,12 @@ export async function cancelReservation(
   duration: number,
   cancellationReason: string
 ): Promise<CancelReservationResponse> {
+  const formattedDate = formatDate(date);
+
   log.info('Canceling reservation', {
     reservationId,
     confirmationNumber,
-    date: formatDate(date),
+    date: formattedDate,
     startTime,
     duration,
     reason: cancellationReason,
@@ -812,9 +1327,9 @@ export async function cancelReservation(
   });
 
   // Format start and end datetime in the format CourtReserve expects
-  const startDateTime12 = formatDateTime(date, startTime);
-  const endTime12 = calculateEndTime(startTime, duration);
-  const endDateTime = `${formatDate(date)} ${endTime12}`;
+  const { startDisplay, endTime12 } = getSlotFormats(startTime, duration);
+  const startDateTime12 = `${formattedDate} ${startDisplay}`;
+  const endDateTime = `${formattedDate} ${endTime12}`;
 
   const url = `${API_DOMAINS.main}/Online/MyProfile/CancelReservation/${config.venue.orgId}`;
   log.debug('Cancellation URL', { url });
@@ -870,7 +1385,7 @@ export async function cancelReservation(
       };
     }
 
-    const data: CancelReservationResponse = await response.json();
+    const data = (await response.json()) as CancelReservationResponse;
 
     if (data.isValid) {
       log.info('CANCELLATION SUCCESSFUL!', {
@@ -951,12 +1466,14 @@ export async function getUnpaidTransactions(
     throw new Error(`GetUnPaidTransactions failed: ${response.status}`);
   }
 
-  const rawData = await response.json();
+  const rawData = (await response.json()) as UnpaidTransaction[] | { Data?: UnpaidTransaction[] };
 
-  log.debug('Unpaid transactions raw response', {
-    rawData: JSON.stringify(rawData).substring(0, 500),
-    isArray: Array.isArray(rawData),
-  });
+  if (log.isLevelEnabled(LogLevel.DEBUG)) {
+    log.debug('Unpaid transactions raw response', {
+      rawData: JSON.stringify(rawData).substring(0, 500),
+      isArray: Array.isArray(rawData),
+    });
+  }
 
   // The API might wrap the array in an object
   const data: UnpaidTransaction[] = Array.isArray(rawData) ? rawData : rawData.Data || [];
@@ -14,6 +14,9 @@ export interface Cookie {
 
 export class CookieManager {
   private cookies: Map<string, Cookie> = new Map();
+  // Cached Cookie header; rebuilt only when the jar changes or a cookie expires
+  private serialized: string | null = null;
+  private serializedValidUntil = Infinity;
 
   /**
    * Parse Set-Cookie headers from a response
@@ -25,6 +28,7 @@ export class CookieManager {
       const cookie = this.parseCookieString(setCookie);
       if (cookie) {
         this.cookies.set(cookie.name, cookie);
+        this.serialized = null;
       }
     }
   }
@@ -72,16 +76,28 @@ export class CookieManager {
    * Serialize cookies to a Cookie header string
    */
   serializeCookies(): string {
-    return Array.from(this.cookies.values())
-      .filter(cookie => {
-        // Filter out expired cookies
-        if (cookie.expires && cookie.expires < new Date()) {
-          return false;
-        }
-        return true;
-      })
-      .map(cookie => `${cookie.name}=${cookie.value}`)
-      .join('; ');
+    const now = Date.now();
+    if (this.serialized !== null && now < this.serializedValidUntil) {
+      return this.serialized;
+    }
+
+    const pairs: string[] = [];
+    let validUntil = Infinity;
+    for (const cookie of this.cookies.values()) {
+      // Filter out expired cookies
+      const expiresAt = cookie.expires?.getTime();
+      if (expiresAt !== undefined && expiresAt < now) {
+        continue;
+      }
+      if (expiresAt !== undefined && expiresAt < validUntil) {
+        validUntil = expiresAt;
+      }
+      pairs.push(`${cookie.name}=${cookie.value}`);
+    }
+
+    this.serialized = pairs.join('; ');
+    this.serializedValidUntil = validUntil;
+    return this.serialized;
   }
 
   /**
@@ -96,6 +112,7 @@ export class CookieManager {
    */
   setCookie(cookie: Cookie): void {
     this.cookies.set(cookie.name, cookie);
+    this.serialized = null;
   }
 
   /**
@@ -103,6 +120,7 @@ export class CookieManager {
    */
   clear(): void {
     this.cookies.clear();
+    this.serialized = null;
   }
 
   /**
@@ -20,14 +20,16 @@ export class CourtReserveClient {
   private venue: VenueConfig;
   private cookieManager: CookieManager;
   private email: string;
-  private password: string;
+  private loginBody: string; // Serialized once; the password is only needed for this
   private isAuthenticated: boolean = false;
   private loginAttempts: number = 0;
   private lastLoginTime: Date | null = null;
+  private loginInFlight: Promise<boolean> | null = null;
 
   // Retry configuration
   private static readonly MAX_LOGIN_RETRIES = 3;
   private static readonly RETRY_DELAYS = [1000, 2000, 4000]; // 1s, 2s, 4s exponential backoff
+  private static readonly RETRY_JITTER = 0.2; // ±20%, so accounts that failed together don't retry in lockstep
 
   constructor(config: CourtReserveClientConfig) {
     log.debug('Creating CourtReserve client', {
@@ -47,7 +49,7 @@ export class CourtReserveClient {
     this.venue = venueConfig;
     this.cookieManager = new CookieManager();
     this.email = config.email;
-    this.password = config.password;
+    this.loginBody = api.buildLoginBody(config.email, config.password);
 
     log.info('CourtReserve client created', {
       venue: venueConfig.name,
@@ -58,8 +60,18 @@ export class CourtReserveClient {
 
   /**
    * Login to CourtReserve with retry logic for transient failures
+   * Concurrent callers share one in-flight login instead of racing on the cookie jar
    */
-  async login(): Promise<boolean> {
+  login(): Promise<boolean> {
+    if (!this.loginInFlight) {
+      this.loginInFlight = this.performLogin().finally(() => {
+        this.loginInFlight = null;
+      });
+    }
+    return this.loginInFlight;
+  }
+
+  private async performLogin(): Promise<boolean> {
     let lastError: Error | null = null;
 
     for (let attempt = 1; attempt <= CourtReserveClient.MAX_LOGIN_RETRIES; attempt++) {
@@ -80,7 +92,7 @@ export class CourtReserveClient {
 
         // Perform login
         log.debug('Performing login...');
-        const response = await api.login(this.getApiConfig(), this.email, this.password);
+        const response = await api.login(this.getApiConfig(), this.email, this.loginBody);
 
         const elapsed = Date.now() - startTime;
 
@@ -130,7 +142,8 @@ export class CourtReserveClient {
 
         // Retry transient errors (network, timeout) with exponential backoff
         if (attempt < CourtReserveClient.MAX_LOGIN_RETRIES) {
-          const delay = CourtReserveClient.RETRY_DELAYS[attempt - 1];
+          const jitter = 1 + (Math.random() * 2 - 1) * CourtReserveClient.RETRY_JITTER;
+          const delay = Math.round(CourtReserveClient.RETRY_DELAYS[attempt - 1] * jitter);
           log.info('Retrying login after transient error', {
             attempt,
             nextAttempt: attempt + 1,
@@ -158,6 +171,13 @@ export class CourtReserveClient {
    * Refresh the session (clear cookies and re-login)
    */
   async refreshSession(): Promise<void> {
+    // Another caller is already re-authenticating; clearing cookies now would break its login
+    if (this.loginInFlight) {
+      log.debug('Login already in progress, waiting for it');
+      await this.loginInFlight;
+      return;
+    }
+
     log.info('Refreshing session', {
       email: this.email,
       venue: this.venue.name,
@@ -221,6 +241,32 @@ export class CourtReserveClient {
     }
   }
 
+  /**
+   * Get available courts for every slot/duration combination in one request
+   * @returns Map keyed by "HH:MM-duration", in priority order (durations, then slots)
+   */
+  async getCourtAvailability(
+    date: Date | string,
+    timeSlots: string[],
+    durations: number[]
+  ): Promise<Map<string, Court[]>> {
+    await this.ensureAuthenticated();
+
+    try {
+      return await api.getCourtAvailability(this.getApiConfig(), date, timeSlots, durations);
+    } catch (error) {
+      // Try refreshing session once on failure
+      const errorMessage = error instanceof Error ? error.message : String(error);
+      if (errorMessage.includes('401') || errorMessage.includes('403')) {
+        log.warn('Auth error getting court availability, refreshing session', { error: errorMessage });
+        await this.refreshSession();
+        return await api.getCourtAvailability(this.getApiConfig(), date, timeSlots, durations);
+      }
+      log.error('Failed to get court availability', { error: errorMessage });
+      throw error;
+    }
+  }
+
   /**
    * Book a court
    */
@@ -429,20 +475,21 @@ export class CourtReserveClient {
   }
 
   /**
-   * Pre-fetch the booking form for a specific court/time/duration
+   * Pre-fetch the booking form for a specific time/duration
+   * The CSRF token and hidden fields don't depend on the court, so one form serves every court in the slot
    * Called during prep phase at 11:59 to avoid form-fetching latency at noon
+   * If the likely court is known, its request body is encoded now as well
    */
   async prefetchBookingForm(
     date: string,
     startTime: string,
     duration: number,
-    courtId: number
+    courtId?: number
   ): Promise<PreFetchedForm> {
     log.debug('Pre-fetching booking form', {
       date,
       startTime,
       duration,
-      courtId,
       venue: this.venue.name,
     });
 
@@ -456,16 +503,16 @@ export class CourtReserveClient {
       date,
       startTime,
       duration,
-      courtId,
       elapsed: `${fetchElapsed}ms`,
       hasCSRFToken: !!formData.__RequestVerificationToken,
     });
 
+    api.prepareReservationBody(this.getApiConfig(), formData, startTime, duration, courtId);
+
     return {
       formData,
       timeSlot: startTime,
       duration,
-      courtId,
       fetchedAt: new Date(),
     };
   }
@@ -0,0 +1,73 @@
+/**
+ * Shared HTTP connection pool for CourtReserve requests
+ *
+ * Node's default fetch dispatcher drops idle sockets after ~4 seconds, so the
+ * connections opened during noon preparation (11:59) are gone by 12:00 and the
+ * booking POST pays a fresh TCP + TLS handshake. All CourtReserve traffic is
+ * routed through this agent instead, which keeps sockets to the three API hosts
+ * alive long enough to bridge the prep -> execute gap. Requests use undici's own
+ * fetch, not Node's built-in one, so the agent and fetch come from the same
+ * undici release.
+ *
+ * Set COURTRESERVE_HTTP2=true to also offer HTTP/2 via ALPN, so concurrent form
+ * fetches and booking POSTs to a host can share one connection. It is off by
+ * default because undici's HTTP/2 support is still experimental.
+ */
+
+import { Agent, fetch, type Response } from 'undici';
+import { API_DOMAINS } from './types';
+import { createLogger } from '../logger';
+
+const log = createLogger('CourtReserve:HttpPool');
+
+const KEEP_ALIVE_TIMEOUT_MS = 90 * 1000; // Outlive the 60s gap between prep and execute
+const KEEP_ALIVE_MAX_TIMEOUT_MS = 10 * 60 * 1000; // Upper bound when the server sends a Keep-Alive hint
+const MAX_CONNECTIONS_PER_ORIGIN = 32; // Enough for every parallel form fetch in a noon burst
+const HTTP2_ENABLED = process.env.COURTRESERVE_HTTP2 === 'true'; // Opt-in, default HTTP/1.1
+const HEARTBEAT_PATH = '/favicon.ico'; // Static, so touching a connection costs the server nothing
+const WARM_TIMEOUT_MS = 3000; // A stuck warm-up request must not still hold a socket at noon
+
+export const httpAgent = new Agent({
+  keepAliveTimeout: KEEP_ALIVE_TIMEOUT_MS,
+  keepAliveMaxTimeout: KEEP_ALIVE_MAX_TIMEOUT_MS,
+  connections: MAX_CONNECTIONS_PER_ORIGIN,
+  allowH2: HTTP2_ENABLED,
+});
+
+let warmConnectionsPerOrigin = 1; // Remembered, so heartbeats keep the last burst's pool warm
+
+/**
+ * Open (or refresh) pooled connections to each CourtReserve host
+ * HEAD of a static asset: the TCP + TLS handshakes happen before they are on the critical
+ * path, without the server rendering an app page or redirecting to login.
+ * Concurrent HEADs make HTTP/1.1 hosts open one socket per expected parallel session.
+ * @param connectionsPerOrigin - Sockets to warm per host (default: the last requested count)
+ */
+export async function warmConnections(connectionsPerOrigin: number = warmConnectionsPerOrigin): Promise<void> {
+  warmConnectionsPerOrigin = Math.min(MAX_CONNECTIONS_PER_ORIGIN, Math.max(1, connectionsPerOrigin));
+  const startTime = Date.now();
+  const origins = Object.values(API_DOMAINS);
+
+  const requests: Promise<Response>[] = [];
+  for (const origin of origins) {
+    for (let i = 0; i < warmConnectionsPerOrigin; i++) {
+      requests.push(
+        fetch(`${origin}${HEARTBEAT_PATH}`, {
+          method: 'HEAD',
+          redirect: 'manual',
+          signal: AbortSignal.timeout(WARM_TIMEOUT_MS),
+          dispatcher: httpAgent,
+        })
+      );
+    }
+  }
+  const results = await Promise.allSettled(requests);
+
+  const warmed = results.filter((r) => r.status === 'fulfilled').length;
+  log.debug('Connections warmed', {
+    warmed,
+    total: requests.length,
+    connectionsPerOrigin: warmConnectionsPerOrigin,
+    elapsed: `${Date.now() - startTime}ms`,
+  });
+}
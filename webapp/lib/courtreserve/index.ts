@@ -32,5 +32,8 @@ export type {
 
 export { VENUES, API_DOMAINS, USER_AGENT, TIMEZONE } from './types';
 
+export { warmConnections } from './http-pool';
+export { suspendPacing } from './rate-limiter';
+
 // Export API functions needed for pre-fetching forms
 export { fetchReservationForm, submitReservationWithForm } from './api';
@@ -0,0 +1,115 @@
+/**
+ * Per-host request pacing for CourtReserve lookups
+ *
+ * Noon preparation and polling can fire dozens of availability and form
+ * requests at once. Bursting past the server's limits earns throttled or empty
+ * responses exactly when they matter, so lookup traffic goes through a token
+ * bucket per host. The reservations host (booking POSTs) is exempt, so a
+ * booking never queues behind lookups, and pacing is suspended entirely while
+ * the noon prep and booking window run, when every request is on the clock.
+ *
+ * Set COURTRESERVE_RATE_LIMIT to the requests/second allowed per host
+ * (default: 8, 0 disables pacing).
+ */
+
+import { performance } from 'perf_hooks';
+import { API_DOMAINS } from './types';
+import { createLogger } from '../logger';
+
+const log = createLogger('CourtReserve:RateLimiter');
+
+const DEFAULT_RATE_PER_SEC = 8;
+const configuredRate = process.env.COURTRESERVE_RATE_LIMIT ? Number(process.env.COURTRESERVE_RATE_LIMIT) : NaN;
+const RATE_PER_SEC = Number.isFinite(configuredRate) && configuredRate >= 0 ? configuredRate : DEFAULT_RATE_PER_SEC;
+const BURST = Math.max(1, RATE_PER_SEC); // Allow up to one second's worth of requests at once
+
+export class TokenBucket {
+  private tokens: number;
+  private lastRefill: number;
+  private queue: Promise<void> = Promise.resolve(); // Waiters are served in arrival order
+  private waiting = 0;
+
+  /**
+   * @param now - Millisecond clock, monotonic by default (tests pass a fake one)
+   */
+  constructor(
+    private readonly ratePerSec: number,
+    private readonly burst: number,
+    private readonly now: () => number = () => performance.now()
+  ) {
+    this.tokens = burst;
+    this.lastRefill = now();
+  }
+
+  /**
+   * Wait until a request may be sent
+   */
+  acquire(): Promise<void> {
+    // Fast path: nobody queued and a token is available
+    this.refill();
+    if (this.waiting === 0 && this.tokens >= 1) {
+      this.tokens -= 1;
+      return Promise.resolve();
+    }
+
+    this.waiting++;
+    const turn = this.queue
+      .then(() => this.take())
+      .finally(() => {
+        this.waiting--;
+      });
+    this.queue = turn;
+    return turn;
+  }
+
+  private async take(): Promise<void> {
+    this.refill();
+    if (this.tokens < 1) {
+      const waitMs = ((1 - this.tokens) / this.ratePerSec) * 1000;
+      await new Promise((resolve) => setTimeout(resolve, waitMs));
+      this.refill();
+    }
+    this.tokens -= 1;
+  }
+
+  private refill(): void {
+    const now = this.now();
+    this.tokens = Math.min(this.burst, this.tokens + ((now - this.lastRefill) / 1000) * this.ratePerSec);
+    this.lastRefill = now;
+  }
+}
+
+const buckets = new Map<string, TokenBucket>();
+let suspendedCount = 0; // Overlapping suspensions nest; pacing resumes when the last one ends
+
+/**
+ * Send every request unpaced until the returned function is called
+ */
+export function suspendPacing(): () => void {
+  suspendedCount++;
+  let resumed = false;
+  return () => {
+    if (!resumed) {
+      resumed = true;
+      suspendedCount--;
+    }
+  };
+}
+
+/**
+ * Wait for the request's host to have capacity (no-op for exempt hosts or when disabled)
+ */
+export function acquireRequestSlot(url: string): Promise<void> | undefined {
+  if (RATE_PER_SEC === 0 || suspendedCount > 0 || url.startsWith(API_DOMAINS.reservations)) {
+    return undefined;
+  }
+
+  const origin = new URL(url).origin;
+  let bucket = buckets.get(origin);
+  if (!bucket) {
+    bucket = new TokenBucket(RATE_PER_SEC, BURST);
+    buckets.set(origin, bucket);
+    log.debug('Rate limiter created', { origin, ratePerSec: RATE_PER_SEC, burst: BURST });
+  }
+  return bucket.acquire();
+}
@@ -55,21 +55,70 @@ export function addSeconds(time: string): string {
  */
 export function calculateEndTime(startTime: string, durationMinutes: number): string {
   const [hoursStr, minutesStr] = startTime.split(':');
-  let totalMinutes = parseInt(hoursStr, 10) * 60 + parseInt(minutesStr, 10) + durationMinutes;
+  const totalMinutes = parseInt(hoursStr, 10) * 60 + parseInt(minutesStr, 10) + durationMinutes;
 
   const hours = Math.floor(totalMinutes / 60) % 24;
   const minutes = totalMinutes % 60;
 
-  const endTime24 = `${hours.toString().padStart(2, '0')}:${minutes.toString().padStart(2, '0')}`;
-  return to12Hour(endTime24);
+  // Format directly from the integers rather than building "HH:MM" and re-parsing it
+  const period = hours >= 12 ? 'PM' : 'AM';
+  const hours12 = hours % 12 || 12;
+  return `${hours12}:${minutes.toString().padStart(2, '0')} ${period}`;
+}
+
+/**
+ * Format minutes since midnight as "HH:MM"
+ */
+function formatMinutesOfDay(totalMinutes: number): string {
+  const hours = Math.floor(totalMinutes / 60);
+  const minutes = totalMinutes % 60;
+  return `${hours.toString().padStart(2, '0')}:${minutes.toString().padStart(2, '0')}`;
+}
+
+/**
+ * Every string shape CourtReserve needs for one slot/duration
+ */
+export interface SlotFormats {
+  startTime24: string; // "HH:MM:SS"
+  startDisplay: string; // "H:MM:SS AM/PM"
+  endTime12: string; // "H:MM AM/PM"
 }
 
+// Slots and durations come from a small fixed set, so each combo is formatted once per process
+const slotFormatsCache = new Map<string, SlotFormats>();
+
+/**
+ * Get the formatted strings for a slot/duration, computing them on first use
+ * @param startTime - Start time in "HH:MM" format
+ * @param durationMinutes - Duration in minutes
+ */
+export function getSlotFormats(startTime: string, durationMinutes: number): SlotFormats {
+  const key = `${startTime}-${durationMinutes}`;
+  let formats = slotFormatsCache.get(key);
+  if (!formats) {
+    formats = {
+      startTime24: addSeconds(startTime),
+      startDisplay: to12HourWithSeconds(startTime),
+      endTime12: calculateEndTime(startTime, durationMinutes),
+    };
+    slotFormatsCache.set(key, formats);
+  }
+  return formats;
+}
+
+const ISO_DATE_RE = /^\d{4}-\d{2}-\d{2}$/;
+
 /**
  * Format date as MM/DD/YYYY
  * @param date - Date object or YYYY-MM-DD string
  * @returns Date in "MM/DD/YYYY" format
  */
 export function formatDate(date: Date | string): string {
+  // Fast path: rearrange YYYY-MM-DD directly instead of round-tripping through Date
+  if (typeof date === 'string' && ISO_DATE_RE.test(date)) {
+    return `${date.slice(5, 7)}/${date.slice(8, 10)}/${date.slice(0, 4)}`;
+  }
+
   const d = typeof date === 'string' ? new Date(date + 'T00:00:00') : date;
   const month = (d.getMonth() + 1).toString().padStart(2, '0');
   const day = d.getDate().toString().padStart(2, '0');
@@ -88,15 +137,6 @@ export function formatDateTime(date: Date | string, time: string): string {
   return `${formatDate(date)} ${to12HourWithSeconds(time)}`;
 }
 
-/**
- * Format date with midnight time "MM/DD/YYYY 12:00:00 AM"
- * @param date - Date object or YYYY-MM-DD string
- * @returns Formatted string
- */
-export function formatDateMidnight(date: Date | string): string {
-  return `${formatDate(date)} 12:00:00 AM`;
-}
-
 /**
  * Generate time slots with flexibility
  * @param preferredTime - Preferred time in "HH:MM" format
@@ -118,17 +158,13 @@ export function generateTimeSlots(preferredTime: string, flexibilityMinutes: num
     // Later slot
     const laterMinutes = baseMinutes + offset;
     if (laterMinutes < 24 * 60) {
-      const hours = Math.floor(laterMinutes / 60);
-      const minutes = laterMinutes % 60;
-      slots.push(`${hours.toString().padStart(2, '0')}:${minutes.toString().padStart(2, '0')}`);
+      slots.push(formatMinutesOfDay(laterMinutes));
     }
 
     // Earlier slot
     const earlierMinutes = baseMinutes - offset;
     if (earlierMinutes >= 0) {
-      const hours = Math.floor(earlierMinutes / 60);
-      const minutes = earlierMinutes % 60;
-      slots.push(`${hours.toString().padStart(2, '0')}:${minutes.toString().padStart(2, '0')}`);
+      slots.push(formatMinutesOfDay(earlierMinutes));
     }
   }
 
@@ -154,12 +190,3 @@ export function generateDurations(preferredDuration: number, minDuration: number
 
   return durations;
 }
-
-/**
- * URL-encode a value for use in query parameters
- * @param value - Value to encode
- * @returns URL-encoded string
- */
-export function urlEncode(value: string): string {
-  return encodeURIComponent(value);
-}
@@ -77,7 +77,6 @@ export interface PreFetchedForm {
   formData: ReservationFormData;
   timeSlot: string;      // e.g., "18:00"
   duration: number;      // e.g., 120
-  courtId: number;       // e.g., 52039
   fetchedAt: Date;       // When this was fetched (for staleness checks)
 }
 
@@ -15,6 +15,7 @@
  * - Logs are written to /app/data/logs/ directory
  * - Files are named by date: YYYY-MM-DD.log
  * - Set LOG_TO_FILE=true to enable (default: true in production)
+ * - Lines are buffered and appended about once a second, not written one by one
  */
 
 import * as fs from 'fs';
@@ -52,40 +53,97 @@ const RESET_COLOR = '\x1b[0m';
 // File logging configuration
 const LOG_DIR = process.env.LOG_DIR || '/app/data/logs';
 const LOG_TO_FILE = process.env.LOG_TO_FILE !== 'false'; // Default true
+const FILE_FLUSH_INTERVAL_MS = 1000; // Batch file writes, flushing at most once a second
+const FILE_BUFFER_MAX_LINES = 256; // Flush early when a burst fills the buffer
+
+let logDirReady = false; // Checked once, not on every line
 
 // Ensure log directory exists
 function ensureLogDir(): void {
+  if (logDirReady) return;
   try {
     if (!fs.existsSync(LOG_DIR)) {
       fs.mkdirSync(LOG_DIR, { recursive: true });
     }
+    logDirReady = true;
   } catch (error) {
     console.error('Failed to create log directory:', error);
   }
 }
 
+// Formatters are built once; toLocaleString() with options constructs a new one per call
+const TIMESTAMP_FORMAT = new Intl.DateTimeFormat('en-US', {
+  timeZone: 'America/Los_Angeles',
+  year: 'numeric',
+  month: '2-digit',
+  day: '2-digit',
+  hour: '2-digit',
+  minute: '2-digit',
+  second: '2-digit',
+  hour12: false,
+});
+const LOG_FILE_DATE_FORMAT = new Intl.DateTimeFormat('en-CA', { timeZone: 'America/Los_Angeles' });
+
+// Timestamps only change once a second, so reuse the last formatted one
+let lastTimestampSecond = -1;
+let lastTimestamp = '';
+
+function formatTimestamp(): string {
+  const second = Math.floor(Date.now() / 1000);
+  if (second !== lastTimestampSecond) {
+    // Format in PST for easier debugging
+    lastTimestamp = TIMESTAMP_FORMAT.format(second * 1000).replace(',', '') + ' PST';
+    lastTimestampSecond = second;
+  }
+  return lastTimestamp;
+}
+
 // Get today's log file path (in Pacific time)
 function getLogFilePath(): string {
-  const now = new Date();
-  const pacificDate = now.toLocaleDateString('en-CA', { timeZone: 'America/Los_Angeles' });
+  const pacificDate = LOG_FILE_DATE_FORMAT.format(new Date());
   return path.join(LOG_DIR, `${pacificDate}.log`);
 }
 
-// Write to log file (without ANSI color codes)
-function writeToFile(message: string): void {
-  if (!LOG_TO_FILE) return;
-  
+// Buffered file lines, written in one append per flush instead of one synchronous write per line
+let fileBuffer: string[] = [];
+let flushTimer: NodeJS.Timeout | null = null;
+
+// Write buffered lines to today's log file
+function flushLogFile(): void {
+  if (flushTimer) {
+    clearTimeout(flushTimer);
+    flushTimer = null;
+  }
+  if (fileBuffer.length === 0) return;
+
+  const lines = fileBuffer;
+  fileBuffer = [];
   try {
     ensureLogDir();
-    // Strip ANSI color codes for file output
-    const cleanMessage = message.replace(/\x1b\[[0-9;]*m/g, '');
-    fs.appendFileSync(getLogFilePath(), cleanMessage + '\n');
+    fs.appendFileSync(getLogFilePath(), lines.join('\n') + '\n');
   } catch (error) {
+    logDirReady = false; // The directory may have been removed; re-check on the next write
     // Silently fail - don't want logging errors to break the app
     console.error('Failed to write to log file:', error);
   }
 }
 
+// Write to log file (callers pass the uncolored line)
+function writeToFile(message: string): void {
+  if (!LOG_TO_FILE) return;
+
+  fileBuffer.push(message);
+  if (fileBuffer.length >= FILE_BUFFER_MAX_LINES) {
+    flushLogFile();
+  } else if (!flushTimer) {
+    flushTimer = setTimeout(flushLogFile, FILE_FLUSH_INTERVAL_MS);
+    flushTimer.unref(); // Pending log lines shouldn't keep the process alive
+  }
+}
+
+// Don't lose the last second of logs on shutdown (process.exit included)
+process.on('exit', flushLogFile);
+
 function parseLogLevel(level: string | undefined): LogLevel {
   if (!level) return LogLevel.INFO;
 
@@ -112,49 +170,37 @@ function parseLogLevel(level: string | undefined): LogLevel {
 
 export class Logger {
   private module: string;
+  private levelTags: string[]; // Per level: "] [LEVEL] [module]", built once
+  private consoleTags: string[]; // The same, closing the level color
   private static globalLevel: LogLevel = parseLogLevel(process.env.LOG_LEVEL);
 
   constructor(module: string) {
     this.module = module;
+    this.levelTags = [];
+    this.consoleTags = [];
+    for (const level of Object.keys(LOG_LEVEL_NAMES).map(Number) as LogLevel[]) {
+      this.levelTags[level] = `] [${LOG_LEVEL_NAMES[level].padEnd(5)}] [${module}]`;
+      this.consoleTags[level] = `${this.levelTags[level]}${RESET_COLOR}`;
+    }
   }
 
-  private formatTimestamp(): string {
-    const now = new Date();
-    // Format in PST for easier debugging
-    return now.toLocaleString('en-US', {
-      timeZone: 'America/Los_Angeles',
-      year: 'numeric',
-      month: '2-digit',
-      day: '2-digit',
-      hour: '2-digit',
-      minute: '2-digit',
-      second: '2-digit',
-      hour12: false,
-    }).replace(',', '') + ' PST';
-  }
-
-  private formatMessage(level: LogLevel, message: string, data?: any): string {
-    const timestamp = this.formatTimestamp();
-    const levelName = LOG_LEVEL_NAMES[level].padEnd(5);
-    const color = LOG_LEVEL_COLORS[level];
-
-    let formattedMessage = `${color}[${timestamp}] [${levelName}] [${this.module}]${RESET_COLOR} ${message}`;
-
-    if (data !== undefined) {
-      if (typeof data === 'object') {
-        formattedMessage += '\n' + JSON.stringify(data, null, 2);
-      } else {
-        formattedMessage += ` ${data}`;
-      }
+  private formatMessage(message: string, data?: any): string {
+    if (data === undefined) {
+      return message;
     }
-
-    return formattedMessage;
+    if (typeof data === 'object') {
+      return `${message}\n${JSON.stringify(data, null, 2)}`;
+    }
+    return `${message} ${data}`;
   }
 
   private log(level: LogLevel, message: string, data?: any): void {
     if (level < Logger.globalLevel) return;
 
-    const formatted = this.formatMessage(level, message, data);
+    // The header is the only colored part, so the file line is built without it instead of stripped
+    const timestamp = formatTimestamp();
+    const body = this.formatMessage(message, data);
+    const formatted = `${LOG_LEVEL_COLORS[level]}[${timestamp}${this.consoleTags[level]} ${body}`;
 
     // Write to console
     switch (level) {
@@ -169,7 +215,15 @@ export class Logger {
     }
 
     // Write to file
-    writeToFile(formatted);
+    writeToFile(`[${timestamp}${this.levelTags[level]} ${body}`);
+  }
+
+  /**
+   * Check whether a level would be logged
+   * Use to skip building expensive log payloads on hot paths
+   */
+  isLevelEnabled(level: LogLevel): boolean {
+    return level >= Logger.globalLevel;
   }
 
   /**
@@ -21,6 +21,9 @@ const NTFY_SERVER = process.env.NTFY_SERVER || 'https://ntfy.sh';
 const NTFY_TOPIC = process.env.NTFY_TOPIC || '';
 const NTFY_ENABLED = process.env.NTFY_ENABLED !== 'false';
 const NTFY_CLICK_BASE_URL = process.env.NTFY_CLICK_BASE_URL || 'https://pickleball.ashayc.com';
+const NTFY_TIMEOUT_MS = 5000; // A slow ntfy server must not hold a notification open indefinitely
+const RESERVATIONS_URL = `${NTFY_CLICK_BASE_URL}/reservations`;
+const BOOKING_JOBS_URL = `${NTFY_CLICK_BASE_URL}/booking-jobs`;
 
 // Priority levels for ntfy
 type Priority = 'min' | 'low' | 'default' | 'high' | 'max';
@@ -43,6 +46,12 @@ interface NotificationAction {
   clear?: boolean;
 }
 
+// Built once; the success notification is sent right after a booking lands
+const VIEW_RESERVATIONS_ACTIONS: NotificationAction[] = [
+  { action: 'view', label: 'View Reservations', url: RESERVATIONS_URL },
+];
+const VIEW_JOBS_ACTIONS: NotificationAction[] = [{ action: 'view', label: 'View Jobs', url: BOOKING_JOBS_URL }];
+
 /**
  * Send a notification via ntfy.sh
  */
@@ -118,6 +127,7 @@ export async function sendNotification(
       method: 'POST',
       headers,
       body: message,
+      signal: AbortSignal.timeout(NTFY_TIMEOUT_MS),
     });
 
     if (!response.ok) {
@@ -168,14 +178,8 @@ export async function notifyBookingSuccess(params: {
     priority: 'high',
     tags: ['white_check_mark', 'tennis'],
     markdown: true,
-    click: `${NTFY_CLICK_BASE_URL}/reservations`,
-    actions: [
-      {
-        action: 'view',
-        label: 'View Reservations',
-        url: `${NTFY_CLICK_BASE_URL}/reservations`,
-      },
-    ],
+    click: RESERVATIONS_URL,
+    actions: VIEW_RESERVATIONS_ACTIONS,
   });
 }
 
@@ -204,14 +208,8 @@ export async function notifyBookingFailure(params: {
     priority: 'high',
     tags: ['x', 'warning'],
     markdown: true,
-    click: `${NTFY_CLICK_BASE_URL}/booking-jobs`,
-    actions: [
-      {
-        action: 'view',
-        label: 'View Jobs',
-        url: `${NTFY_CLICK_BASE_URL}/booking-jobs`,
-      },
-    ],
+    click: BOOKING_JOBS_URL,
+    actions: VIEW_JOBS_ACTIONS,
   });
 }
 
@@ -295,7 +293,7 @@ export async function notifyReservationCancelled(params: {
     priority: 'default',
     tags: ['wastebasket'],
     markdown: true,
-    click: `${NTFY_CLICK_BASE_URL}/reservations`,
+    click: RESERVATIONS_URL,
   });
 }
 
@@ -329,14 +327,8 @@ export async function notifyReservationReminder(params: {
     priority: 'default',
     tags: ['calendar', 'bell'],
     markdown: true,
-    click: `${NTFY_CLICK_BASE_URL}/reservations`,
-    actions: [
-      {
-        action: 'view',
-        label: 'View Reservations',
-        url: `${NTFY_CLICK_BASE_URL}/reservations`,
-      },
-    ],
+    click: RESERVATIONS_URL,
+    actions: VIEW_RESERVATIONS_ACTIONS,
   });
 }
 
@@ -0,0 +1,136 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest'
+import type { JobWithAccount } from '../types'
+
+const { mockLogin } = vi.hoisted(() => ({ mockLogin: vi.fn<() => Promise<void>>() }))
+
+vi.mock('../../courtreserve', () => ({
+  CourtReserveClient: class {
+    login = mockLogin
+    isLoggedIn() {
+      return false // Never reuse a cached session, so every getSession call may log in
+    }
+  },
+  generateTimeSlots: vi.fn(),
+  generateDurations: vi.fn(),
+  warmConnections: vi.fn(),
+}))
+vi.mock('../../prisma', () => ({ prisma: {} }))
+vi.mock('../../logger', () => ({
+  createLogger: () => ({
+    trace: vi.fn(),
+    debug: vi.fn(),
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+    isLevelEnabled: () => false,
+  }),
+}))
+
+import { PollingModeHandler } from '../polling-mode'
+
+/**
+ * Tests for the polling login circuit breaker
+ *
+ * After 3 consecutive failed logins for an account/venue, logins pause for
+ * an hour; each failed retry doubles the pause, capped at 6 hours. A
+ * successful login clears the count.
+ */
+
+const MINUTE = 60 * 1000
+const HOUR = 60 * MINUTE
+
+const job = {
+  name: 'Test job',
+  accountId: 'account-1',
+  venue: 'sunnyvale',
+  account: { email: 'player@example.com', password: 'secret' },
+} as unknown as JobWithAccount
+
+type SessionGetter = { getSession(job: JobWithAccount): Promise<unknown> }
+
+describe('Polling login circuit breaker', () => {
+  let handler: SessionGetter
+  let now: number
+
+  function advance(ms: number) {
+    now += ms
+    vi.setSystemTime(now)
+  }
+
+  // Call getSession and report whether it actually tried to log in
+  async function attempt(): Promise<boolean> {
+    const before = mockLogin.mock.calls.length
+    await handler.getSession(job)
+    return mockLogin.mock.calls.length > before
+  }
+
+  async function failLogins(times: number) {
+    for (let i = 0; i < times; i++) {
+      expect(await attempt()).toBe(true)
+    }
+  }
+
+  beforeEach(() => {
+    vi.useFakeTimers({ toFake: ['Date'] })
+    now = new Date('2026-01-14T15:00:00Z').getTime()
+    vi.setSystemTime(now)
+    mockLogin.mockReset()
+    mockLogin.mockRejectedValue(new Error('Invalid credentials'))
+    handler = new PollingModeHandler() as unknown as SessionGetter
+  })
+
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  it('should keep trying until the third consecutive failure', async () => {
+    await failLogins(2)
+    expect(await attempt()).toBe(true)
+    expect(await attempt()).toBe(false)
+  })
+
+  it('should pause for an hour after the threshold is reached', async () => {
+    await failLogins(3)
+
+    advance(59 * MINUTE)
+    expect(await attempt()).toBe(false)
+
+    advance(MINUTE)
+    expect(await attempt()).toBe(true)
+  })
+
+  it('should double the cooldown after each failed retry up to 6 hours', async () => {
+    await failLogins(3)
+
+    // Failed retries after 1h, 2h and 4h pauses, then the 8h step is capped at 6h
+    for (const cooldown of [1 * HOUR, 2 * HOUR, 4 * HOUR, 6 * HOUR, 6 * HOUR]) {
+      advance(cooldown - MINUTE)
+      expect(await attempt()).toBe(false)
+      advance(MINUTE)
+      expect(await attempt()).toBe(true)
+    }
+  })
+
+  it('should reset the failure count after a successful login', async () => {
+    await failLogins(3)
+    advance(HOUR)
+
+    mockLogin.mockResolvedValueOnce(undefined)
+    expect(await attempt()).toBe(true)
+
+    // A fresh run of failures gets the full threshold again
+    await failLogins(2)
+    expect(await attempt()).toBe(true)
+    expect(await attempt()).toBe(false)
+  })
+
+  it('should track accounts separately', async () => {
+    await failLogins(3)
+    expect(await attempt()).toBe(false)
+
+    const otherJob = { ...job, accountId: 'account-2' } as JobWithAccount
+    const before = mockLogin.mock.calls.length
+    await handler.getSession(otherJob)
+    expect(mockLogin.mock.calls.length).toBe(before + 1)
+  })
+})
@@ -0,0 +1,159 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest'
+import type { BookingResult, PreFetchedForm } from '../../courtreserve'
+import type { JobResult, PreparedJob } from '../types'
+
+vi.mock('../../courtreserve', () => ({
+  CourtReserveClient: class {},
+  generateTimeSlots: vi.fn(),
+  generateDurations: vi.fn(),
+  suspendPacing: vi.fn(() => () => {}),
+  warmConnections: vi.fn(),
+}))
+vi.mock('../../prisma', () => ({ prisma: {} }))
+vi.mock('../../logger', () => ({
+  createLogger: () => ({
+    trace: vi.fn(),
+    debug: vi.fn(),
+    info: vi.fn(),
+    warn: vi.fn(),
+    error: vi.fn(),
+    isLevelEnabled: () => false,
+  }),
+}))
+
+import { NoonModeHandler } from '../noon-mode'
+import { LockManager } from '../lock-manager'
+
+/**
+ * Tests for how overlapping window-open attempts settle the window state
+ *
+ * Up to two attempts on the first-choice court can be in flight at once.
+ * When one sees the window open (court taken) and the other hits a
+ * transient error, the job must still move on to its other courts.
+ */
+
+const FIRST_COURT = 101
+const OTHER_COURT = 102
+
+const courtTaken: BookingResult = { success: false, message: 'Court is no longer available' }
+const booked: BookingResult = { success: true, message: 'Booked', externalId: 'R-1' }
+
+interface WindowSignal {
+  isOpen: boolean
+  opened: Promise<void>
+  open: () => void
+}
+
+function makeWindowSignal(): WindowSignal {
+  let resolve!: () => void
+  const signal: WindowSignal = {
+    isOpen: false,
+    opened: new Promise<void>((r) => {
+      resolve = r
+    }),
+    open: () => {
+      signal.isOpen = true
+      resolve()
+    },
+  }
+  return signal
+}
+
+function deferred<T>() {
+  let resolve!: (value: T) => void
+  const promise = new Promise<T>((r) => {
+    resolve = r
+  })
+  return { promise, resolve }
+}
+
+type ExecuteJob = {
+  executeJob(
+    prepared: PreparedJob,
+    lockManager: LockManager,
+    windowSignal: WindowSignal,
+    pendingRecords: Array<() => Promise<void>>
+  ): Promise<JobResult>
+}
+
+describe('Noon window state', () => {
+  let book: ReturnType<typeof vi.fn>
+  let prepared: PreparedJob
+  let windowSignal: WindowSignal
+
+  beforeEach(() => {
+    book = vi.fn()
+    windowSignal = makeWindowSignal()
+    prepared = {
+      job: { id: 'job-1', name: 'Test job', accountId: 'account-1', venue: 'sunnyvale' },
+      client: { bookCourtWithPrefetchedForm: book },
+      targetDate: '2026-01-22',
+      timeSlots: ['18:00'],
+      durations: [60],
+      courtAvailability: new Map([['18:00-60', [FIRST_COURT, OTHER_COURT]]]),
+      preFetchedForms: new Map([['18:00-60', {} as PreFetchedForm]]),
+      firstChoice: { timeSlot: '18:00', duration: 60, courtId: FIRST_COURT },
+    } as unknown as PreparedJob
+  })
+
+  function run(): Promise<JobResult> {
+    const handler = new NoonModeHandler() as unknown as ExecuteJob
+    return handler.executeJob(prepared, new LockManager(), windowSignal, [])
+  }
+
+  it('should try other courts when an error lands before a sibling attempt sees the window open', async () => {
+    const firstAttempt = deferred<BookingResult>()
+    book
+      .mockImplementationOnce(() => {
+        // Another job sees the window open while this attempt is still outstanding,
+        // which starts a second attempt straight away
+        queueMicrotask(() => windowSignal.open())
+        return firstAttempt.promise
+      })
+      .mockImplementationOnce(() => {
+        // The first attempt only reports "court taken" after this one has failed
+        setTimeout(() => firstAttempt.resolve(courtTaken), 0)
+        return Promise.reject(new Error('socket hang up'))
+      })
+      .mockResolvedValueOnce(booked)
+
+    const result = await run()
+
+    expect(result.status).toBe('success')
+    expect(result.courtId).toBe(OTHER_COURT)
+    expect(book).toHaveBeenCalledTimes(3)
+  })
+
+  it('should try other courts when an error lands after a sibling attempt saw the window open', async () => {
+    const firstAttempt = deferred<BookingResult>()
+    book
+      .mockImplementationOnce(() => {
+        queueMicrotask(() => windowSignal.open())
+        return firstAttempt.promise
+      })
+      .mockImplementationOnce(() => {
+        // The first attempt reports "court taken" before this one fails
+        firstAttempt.resolve(courtTaken)
+        return new Promise<BookingResult>((_, reject) => {
+          setTimeout(() => reject(new Error('socket hang up')), 0)
+        })
+      })
+      .mockResolvedValueOnce(booked)
+
+    const result = await run()
+
+    expect(result.status).toBe('success')
+    expect(result.courtId).toBe(OTHER_COURT)
+    expect(book).toHaveBeenCalledTimes(3)
+  })
+
+  it('should still fail the job when the only outcome is an error', async () => {
+    book.mockRejectedValueOnce(new Error('socket hang up'))
+
+    const result = await run()
+
+    expect(result.status).toBe('error')
+    expect(result.errorMessage).toBe('socket hang up')
+    expect(book).toHaveBeenCalledTimes(1)
+  })
+})
@@ -0,0 +1,115 @@
+import { describe, it, expect, vi, beforeAll, afterAll, afterEach } from 'vitest'
+import type { JobWithAccount } from '../types'
+
+vi.mock('../../prisma', () => ({ prisma: {} }))
+
+import { getTargetDates } from '../job-processor'
+
+/**
+ * Tests for polling target dates stopping at the booking window
+ *
+ * Residents can book 7 days out before noon Pacific and 8 after; non-residents
+ * one day less. Dates past the window are never returned, so polling doesn't
+ * spend requests on days CourtReserve hasn't released yet.
+ */
+
+const ALL_DAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+function makeJob(isResident: boolean, overrides: Partial<JobWithAccount> = {}): JobWithAccount {
+  return {
+    name: 'Test job',
+    recurrence: 'weekly',
+    days: JSON.stringify(ALL_DAYS),
+    account: { isResident },
+    ...overrides,
+  } as unknown as JobWithAccount
+}
+
+describe('getTargetDates', () => {
+  const originalTZ = process.env.TZ
+
+  beforeAll(() => {
+    process.env.TZ = 'America/Los_Angeles' // Same zone the container runs in
+  })
+
+  afterAll(() => {
+    if (originalTZ === undefined) {
+      delete process.env.TZ
+    } else {
+      process.env.TZ = originalTZ
+    }
+  })
+
+  afterEach(() => {
+    vi.useRealTimers()
+  })
+
+  // Wednesday 2026-01-14, Pacific time
+  function setPacificTime(time: string) {
+    vi.useFakeTimers()
+    vi.setSystemTime(new Date(`2026-01-14T${time}-08:00`))
+  }
+
+  const throughDay6 = ['2026-01-15', '2026-01-16', '2026-01-17', '2026-01-18', '2026-01-19', '2026-01-20']
+  const throughDay7 = [...throughDay6, '2026-01-21']
+
+  it('should include day 7 for residents before noon', () => {
+    setPacificTime('10:00:00')
+    expect(getTargetDates(makeJob(true))).toEqual(throughDay7)
+  })
+
+  it('should include day 7 for residents after noon', () => {
+    setPacificTime('13:00:00')
+    expect(getTargetDates(makeJob(true))).toEqual(throughDay7)
+  })
+
+  it('should stop before day 7 for non-residents before noon', () => {
+    setPacificTime('11:59:59')
+    expect(getTargetDates(makeJob(false))).toEqual(throughDay6)
+  })
+
+  it('should include day 7 for non-residents from noon', () => {
+    setPacificTime('12:00:00')
+    expect(getTargetDates(makeJob(false))).toEqual(throughDay7)
+  })
+
+  it('should skip a one-time date on day 7 until it is released', () => {
+    const job = makeJob(false, { recurrence: 'once', days: JSON.stringify(['2026-01-21']) })
+
+    setPacificTime('09:00:00')
+    expect(getTargetDates(job)).toEqual([])
+
+    setPacificTime('12:30:00')
+    expect(getTargetDates(job)).toEqual(['2026-01-21'])
+  })
+
+  it('should step whole calendar days across the spring-forward change', () => {
+    vi.useFakeTimers()
+    vi.setSystemTime(new Date('2026-03-05T10:00:00-08:00'))
+    expect(getTargetDates(makeJob(true))).toEqual([
+      '2026-03-06',
+      '2026-03-07',
+      '2026-03-08',
+      '2026-03-09',
+      '2026-03-10',
+      '2026-03-11',
+      '2026-03-12',
+    ])
+  })
+
+  it('should switch at noon daylight time on the spring-forward day', () => {
+    vi.useFakeTimers()
+    vi.setSystemTime(new Date('2026-03-08T11:59:59-07:00'))
+    expect(getTargetDates(makeJob(false)).at(-1)).toBe('2026-03-14')
+
+    vi.setSystemTime(new Date('2026-03-08T12:00:00-07:00'))
+    expect(getTargetDates(makeJob(false)).at(-1)).toBe('2026-03-15')
+  })
+
+  it('should default to resident limits when residency is unknown', () => {
+    setPacificTime('10:00:00')
+    const job = makeJob(true)
+    job.account = { ...job.account, isResident: undefined as unknown as boolean }
+    expect(getTargetDates(job)).toEqual(throughDay7)
+  })
+})
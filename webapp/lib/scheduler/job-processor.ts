@@ -193,40 +193,33 @@ export function getTargetDates(job: JobWithAccount): string[] {
     today: format(today, 'yyyy-MM-dd'),
   });
 
-  // Check next 7 days
+  if (job.recurrence !== 'weekly' && job.recurrence !== 'once') {
+    return dates;
+  }
+
+  // Parse the configured days once rather than per checked date
+  let days: Set<string>;
+  try {
+    days = new Set(JSON.parse(job.days) as string[]);
+  } catch (error) {
+    log.error(`Failed to parse days JSON for ${job.recurrence === 'weekly' ? 'weekly' : 'one-time'} job`, {
+      jobName: job.name,
+      days: job.days,
+      error: error instanceof Error ? error.message : String(error),
+    });
+    return dates;
+  }
+
+  // Check next 7 days, stopping at the booking window: dates that haven't been released yet
+  // would only earn "only allowed to reserve up to" responses, so they cost no requests until noon
+  const maxBookingDate = getMaxBookingDate(job.account.isResident ?? true);
   for (let i = 1; i <= 7; i++) {
     const checkDate = addDays(today, i);
+    if (checkDate > maxBookingDate) break;
+    const dateStr = format(checkDate, 'yyyy-MM-dd');
 
-    if (job.recurrence === 'weekly') {
-      try {
-        const days = JSON.parse(job.days) as string[];
-        const dayName = format(checkDate, 'EEEE');
-
-        if (days.includes(dayName)) {
-          dates.push(format(checkDate, 'yyyy-MM-dd'));
-        }
-      } catch (error) {
-        log.error('Failed to parse days JSON for weekly job', {
-          jobName: job.name,
-          days: job.days,
-          error: error instanceof Error ? error.message : String(error),
-        });
-      }
-    } else if (job.recurrence === 'once') {
-      try {
-        const days = JSON.parse(job.days) as string[];
-        const dateStr = format(checkDate, 'yyyy-MM-dd');
-
-        if (days.includes(dateStr)) {
-          dates.push(dateStr);
-        }
-      } catch (error) {
-        log.error('Failed to parse days JSON for one-time job', {
-          jobName: job.name,
-          days: job.days,
-          error: error instanceof Error ? error.message : String(error),
-        });
-      }
+    if (job.recurrence === 'weekly' ? days.has(format(checkDate, 'EEEE')) : days.has(dateStr)) {
+      dates.push(dateStr);
     }
   }
 
@@ -330,10 +323,10 @@ export async function recordReservation(
     courtId: attempt.courtId,
   });
 
-  // Send success notification
+  // Send success notification without waiting on ntfy; the booking is already recorded
   if (isNotificationConfigured()) {
     log.debug('Sending booking success notification');
-    await notifyBookingSuccess({
+    void notifyBookingSuccess({
       jobName: job.name,
       venue: job.venue,
       date: attempt.date,
@@ -562,7 +555,7 @@ export async function notifyJobFailure(
     attemptsCount,
   });
 
-  await notifyBookingFailure({
+  void notifyBookingFailure({
     jobName: job.name,
     venue: job.venue,
     date: targetDate,
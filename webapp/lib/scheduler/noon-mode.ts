@@ -5,10 +5,19 @@
  * - Pre-fetch court IDs 60 seconds before noon (no availability check at execution)
  * - Serial execution by priority (no double-booking risk)
  * - Try all courts per slot before moving to next slot
- * - Deferred logging (no I/O blocking during booking)
+ * - Window-open retries keep a steady cadence, overlapping a slow response
+ * - Successful bookings are recorded after all jobs finish, off the booking path
  */
 
-import { CourtReserveClient, generateTimeSlots, generateDurations, PreFetchedForm } from '../courtreserve';
+import {
+  BookingResult,
+  CourtReserveClient,
+  generateTimeSlots,
+  generateDurations,
+  PreFetchedForm,
+  suspendPacing,
+  warmConnections,
+} from '../courtreserve';
 import { LockManager } from './lock-manager';
 import { PreparedJob, JobResult, BookingAttempt, JobWithAccount } from './types';
 import {
@@ -26,9 +35,44 @@ import { notifyBookingFailure, notifyReservationReminder, isNotificationConfigur
 import { prisma } from '../prisma';
 import { addDays, format } from 'date-fns';
 import { createLogger } from '../logger';
+import { raiseProcessPriority, sleepUntilMonotonic, waitUntil } from './timing';
+import { performance } from 'perf_hooks';
 
 const log = createLogger('Scheduler:NoonMode');
 
+/**
+ * Shared "booking window opened" flag for jobs racing the same venue/date window
+ * Lets a job waiting on its retry cadence fire immediately once another job sees the window open
+ */
+interface WindowSignal {
+  isOpen: boolean;
+  opened: Promise<void>;
+  open: () => void;
+}
+
+function createWindowSignal(): WindowSignal {
+  let resolve!: () => void;
+  const signal: WindowSignal = {
+    isOpen: false,
+    opened: new Promise<void>((r) => {
+      resolve = r;
+    }),
+    open: () => {
+      signal.isOpen = true;
+      resolve();
+    },
+  };
+  return signal;
+}
+
+/**
+ * Where a job stands while waiting for the booking window, in precedence order:
+ * a later state always wins. An attempt that saw the window open beats a sibling attempt's
+ * error, so a transient failure doesn't stop the job from trying its other courts
+ */
+type WindowState = 'waiting' | 'failed' | 'open' | 'booked';
+const WINDOW_STATE_ORDER: readonly WindowState[] = ['waiting', 'failed', 'open', 'booked'];
+
 export class NoonModeHandler {
   private preparedJobs: Map<string, PreparedJob> = new Map();
 
@@ -68,7 +112,13 @@ export class NoonModeHandler {
       })(),
     });
 
+    // Logins, availability lookups and form fetches all have to land before noon; don't pace them
+    const resumePacing = suspendPacing();
     try {
+      // Open pooled connections to every CourtReserve host while the job query runs,
+      // so the handshakes are done before the first real request
+      const warming = warmConnections();
+
       // Fetch all active jobs sorted by priority
       const jobs = await fetchActiveJobs();
       log.info('Fetched active jobs', { count: jobs.length });
@@ -78,25 +128,47 @@ export class NoonModeHandler {
         return;
       }
 
-      // Prepare each job
+      await warming;
+
+      // Every account/venue session fires its booking at once; on HTTP/1.1 hosts each needs its
+      // own socket, so widen the warm pool to match while the logins run
+      const sessionCount = new Set(jobs.map((job) => `${job.accountId}-${job.venue}`)).size;
+      const widening = warmConnections(sessionCount);
+
+      // Prepare all jobs concurrently (logins + pre-fetches cost ~1 job's time instead of N).
+      // Jobs for the same account and venue share one client, so each session logs in once.
+      const clients = new Map<string, CourtReserveClient>();
+      await Promise.all(
+        jobs.map(async (job) => {
+          try {
+            log.debug('Preparing job', {
+              jobId: job.id,
+              jobName: job.name,
+              venue: job.venue,
+              account: job.account.email,
+            });
+            await this.prepareJob(job, clients);
+          } catch (error) {
+            log.error('Failed to prepare job', {
+              jobId: job.id,
+              jobName: job.name,
+              error: error instanceof Error ? error.message : String(error),
+              stack: error instanceof Error ? error.stack : undefined,
+            });
+          }
+        })
+      );
+      await widening;
+
+      // Jobs finish preparing in any order; restore priority order for execution
+      const preparedInPriorityOrder = new Map<string, PreparedJob>();
       for (const job of jobs) {
-        try {
-          log.debug('Preparing job', {
-            jobId: job.id,
-            jobName: job.name,
-            venue: job.venue,
-            account: job.account.email,
-          });
-          await this.prepareJob(job);
-        } catch (error) {
-          log.error('Failed to prepare job', {
-            jobId: job.id,
-            jobName: job.name,
-            error: error instanceof Error ? error.message : String(error),
-            stack: error instanceof Error ? error.stack : undefined,
-          });
+        const prepared = this.preparedJobs.get(job.id);
+        if (prepared) {
+          preparedInPriorityOrder.set(job.id, prepared);
         }
       }
+      this.preparedJobs = preparedInPriorityOrder;
 
       const prepareTime = Date.now() - prepareStartTime;
       log.info('=== NOON PREPARATION COMPLETE ===', {
@@ -109,13 +181,15 @@ export class NoonModeHandler {
         error: error instanceof Error ? error.message : String(error),
         stack: error instanceof Error ? error.stack : undefined,
       });
+    } finally {
+      resumePacing();
     }
   }
 
   /**
    * Prepare a single job
    */
-  private async prepareJob(job: JobWithAccount): Promise<void> {
+  private async prepareJob(job: JobWithAccount, clients: Map<string, CourtReserveClient>): Promise<void> {
     log.trace('prepareJob starting', { jobId: job.id, jobName: job.name });
 
     // Calculate target date (8 days ahead)
@@ -196,22 +270,30 @@ export class NoonModeHandler {
       totalAttempts: timeSlots.length * durations.length,
     });
 
-    // Create and authenticate client
-    log.debug('Creating CourtReserve client', {
-      jobName: job.name,
-      venue: job.venue,
-      email: job.account.email,
-    });
+    // Create (or reuse) and authenticate client
+    const clientKey = `${job.accountId}-${job.venue}`;
+    let client = clients.get(clientKey);
+    if (!client) {
+      log.debug('Creating CourtReserve client', {
+        jobName: job.name,
+        venue: job.venue,
+        email: job.account.email,
+      });
 
-    const client = new CourtReserveClient({
-      venue: job.venue,
-      email: job.account.email,
-      password: job.account.password,
-    });
+      client = new CourtReserveClient({
+        venue: job.venue,
+        email: job.account.email,
+        password: job.account.password,
+      });
+      clients.set(clientKey, client);
+    }
 
     try {
       const loginStartTime = Date.now();
-      await client.login();
+      // A login already started by another job for this session is shared, not repeated
+      if (!client.isLoggedIn()) {
+        await client.login();
+      }
       const loginDuration = Date.now() - loginStartTime;
       log.info('Client authenticated', {
         jobName: job.name,
@@ -241,60 +323,51 @@ export class NoonModeHandler {
       durationsCount: durations.length,
     });
 
-    for (const duration of durations) {
-      for (const timeSlot of timeSlots) {
-        const key = `${timeSlot}-${duration}`;
-        try {
-          const courts = await client.getAvailableCourts(targetDate, timeSlot, duration);
-          courtAvailability.set(key, courts.map((c) => c.id));
-        } catch (error) {
-          log.warn('Failed to pre-fetch courts for slot', {
-            jobName: job.name,
-            timeSlot,
-            duration,
-            error: error instanceof Error ? error.message : String(error),
-          });
-          courtAvailability.set(key, []); // Empty array on failure
-        }
-      }
-    }
-
+    // One ReadConsolidated request covers every slot/duration combination for the day
+    const availability = await client
+      .getCourtAvailability(targetDate, timeSlots, durations)
+      .catch((error) => {
+        log.warn('Failed to pre-fetch court availability', {
+          jobName: job.name,
+          targetDate,
+          error: error instanceof Error ? error.message : String(error),
+        });
+        return null;
+      });
     const courtPrefetchDuration = Date.now() - prefetchStartTime;
-    const totalCourts = Array.from(courtAvailability.values()).reduce((sum, ids) => sum + ids.length, 0);
-
-    log.info('Court availability pre-fetched', {
-      jobName: job.name,
-      targetDate,
-      slotsWithCourts: Array.from(courtAvailability.entries()).filter(([, ids]) => ids.length > 0).length,
-      totalCourts,
-      prefetchDurationMs: courtPrefetchDuration,
-    });
 
-    // Pre-fetch booking forms for each court/time/duration combo IN PARALLEL
-    // This is the key optimization - we fetch all forms now so at noon we only POST
+    // Pre-fetch booking forms for each time/duration combo IN PARALLEL
+    // This is the key optimization - we fetch all forms now so at noon we only POST.
+    // The form's CSRF token and hidden fields depend only on date/start/end, so one
+    // form per combo is shared by every court available in it.
     const preFetchedForms = new Map<string, PreFetchedForm>();
     const formFetchStartTime = Date.now();
-
-    // Collect all form fetch promises
     const formFetchPromises: Promise<{ key: string; form: PreFetchedForm | null }>[] = [];
 
-    for (const duration of durations) {
-      for (const timeSlot of timeSlots) {
-        const availabilityKey = `${timeSlot}-${duration}`;
-        const courtIds = courtAvailability.get(availabilityKey) || [];
+    // A single pass in priority order (durations, then slots) records each combination's courts,
+    // starts its form fetch and picks the court to probe for window-open, so execution goes
+    // straight to the POST
+    let firstChoice: PreparedJob['firstChoice'] = null;
+    let totalCourts = 0;
+    if (availability) {
+      for (const duration of durations) {
+        for (const timeSlot of timeSlots) {
+          const formKey = `${timeSlot}-${duration}`;
+          const courtIds = (availability.get(formKey) ?? []).map((c) => c.id);
+          courtAvailability.set(formKey, courtIds);
+          if (courtIds.length === 0) continue;
 
-        for (const courtId of courtIds) {
-          const formKey = `${timeSlot}-${duration}-${courtId}`;
+          totalCourts += courtIds.length;
+          firstChoice ??= { timeSlot, duration, courtId: courtIds[0] };
           formFetchPromises.push(
             client
-              .prefetchBookingForm(targetDate, timeSlot, duration, courtId)
+              .prefetchBookingForm(targetDate, timeSlot, duration, courtIds[0])
               .then((form) => ({ key: formKey, form }))
               .catch((error) => {
                 log.warn('Failed to pre-fetch booking form', {
                   jobName: job.name,
                   timeSlot,
                   duration,
-                  courtId,
                   error: error instanceof Error ? error.message : String(error),
                 });
                 return { key: formKey, form: null };
@@ -304,6 +377,14 @@ export class NoonModeHandler {
       }
     }
 
+    log.info('Court availability pre-fetched', {
+      jobName: job.name,
+      targetDate,
+      slotsWithCourts: formFetchPromises.length,
+      totalCourts,
+      prefetchDurationMs: courtPrefetchDuration,
+    });
+
     log.info('Pre-fetching booking forms in parallel', {
       jobName: job.name,
       targetDate,
@@ -342,6 +423,7 @@ export class NoonModeHandler {
       durations,
       courtAvailability,
       preFetchedForms,
+      firstChoice,
     });
 
     log.debug('Job prepared and stored', {
@@ -359,13 +441,14 @@ export class NoonModeHandler {
   /**
    * Execute phase - Called at 12:00:00 PM
    * Execute all prepared jobs (each job runs serial booking attempts)
+   * @param startAt - Optional wall-clock deadline (epoch ms) to wait for precisely before the first booking
    */
-  async execute(lockManager: LockManager): Promise<JobResult[]> {
+  async execute(lockManager: LockManager, startAt?: number): Promise<JobResult[]> {
     log.info('=== NOON EXECUTION STARTING ===', {
       preparedJobsCount: this.preparedJobs.size,
       activeLocks: lockManager.getActiveLockCount(),
+      startAt: startAt ? new Date(startAt).toISOString() : 'immediately',
     });
-    const executeStartTime = Date.now();
 
     if (this.preparedJobs.size === 0) {
       log.warn('No prepared jobs to execute');
@@ -384,78 +467,122 @@ export class NoonModeHandler {
       })),
     });
 
+    // Run the wait and the burst at raised priority, so other processes can't preempt them
+    const restorePriority = raiseProcessPriority();
+    // Re-logins and slow-path form fetches inside the window must not queue behind the rate limiter
+    const resumePacing = suspendPacing();
+
+    // Cron fires slightly early; hold here until the window opens so the first POST isn't late
+    if (startAt) {
+      await waitUntil(startAt);
+    }
+    const executeStartTime = Date.now();
+
+    // Jobs for the same venue and date share one booking window
+    const windowSignals = new Map<string, WindowSignal>();
+    for (const prepared of jobsList) {
+      const windowKey = `${prepared.job.venue}-${prepared.targetDate}`;
+      if (!windowSignals.has(windowKey)) {
+        windowSignals.set(windowKey, createWindowSignal());
+      }
+    }
+
     // Execute all jobs in parallel (but each job uses serial booking attempts)
+    const pendingRecords: Array<() => Promise<void>> = [];
     const results = await Promise.allSettled(
-      jobsList.map((prepared) => this.executeJob(prepared, lockManager))
+      jobsList.map((prepared) =>
+        this.executeJob(
+          prepared,
+          lockManager,
+          windowSignals.get(`${prepared.job.venue}-${prepared.targetDate}`)!,
+          pendingRecords
+        )
+      )
+    );
+    resumePacing();
+    restorePriority();
+
+    // Persist successful bookings only once every job has finished, so the reservation
+    // details lookup and DB writes don't compete with bookings still in the window
+    await Promise.all(
+      pendingRecords.map((record) =>
+        record().catch((error) => {
+          log.error('Failed to record successful booking', {
+            error: error instanceof Error ? error.message : String(error),
+          });
+        })
+      )
     );
 
-    // Process results
+    // Bookkeeping (DB writes, failure notifications) for each job runs concurrently so one
+    // slow write or notification does not hold up the others
+    const executeStarted = new Date(executeStartTime);
     const jobResults: JobResult[] = [];
-    for (let i = 0; i < results.length; i++) {
-      const result = results[i];
-      const prepared = jobsList[i];
-      const executeStarted = new Date(executeStartTime);
-
-      if (result.status === 'fulfilled') {
-        jobResults.push(result.value);
-        log.debug('Job execution result', {
-          jobName: prepared.job.name,
-          status: result.value.status,
-          attemptsCount: result.value.attempts.length,
-        });
+    await Promise.all(
+      results.map(async (result, i) => {
+        const prepared = jobsList[i];
 
-        // Update last attempt with result details (always, even for non-meaningful events)
-        const targetDate = getTargetDate(prepared.job);
-        await updateLastAttempt(prepared.job.id, result.value, targetDate || undefined);
-
-        // Record history if meaningful
-        if (shouldRecordHistory(result.value, 'noon')) {
-          try {
-            await recordRunHistory(
-              prepared.job.id,
-              'noon',
-              result.value,
-              executeStarted,
-              new Date()
-            );
-            log.debug('Run history recorded', {
-              jobName: prepared.job.name,
-              status: result.value.status,
-            });
-
-            // Send failure notification for meaningful failures
-            if (result.value.status !== 'success' && isNotificationConfigured()) {
-              const targetDate = getTargetDate(prepared.job);
-              const reason =
-                result.value.errorMessage ||
-                'Courts were available but booking failed';
+        if (result.status === 'fulfilled') {
+          jobResults.push(result.value);
+          log.debug('Job execution result', {
+            jobName: prepared.job.name,
+            status: result.value.status,
+            attemptsCount: result.value.attempts.length,
+          });
 
-              await notifyBookingFailure({
+          // Update last attempt with result details (always, even for non-meaningful events)
+          const targetDate = getTargetDate(prepared.job);
+          await updateLastAttempt(prepared.job.id, result.value, targetDate || undefined);
+
+          // Record history if meaningful
+          if (shouldRecordHistory(result.value, 'noon')) {
+            try {
+              await recordRunHistory(
+                prepared.job.id,
+                'noon',
+                result.value,
+                executeStarted,
+                new Date()
+              );
+              log.debug('Run history recorded', {
                 jobName: prepared.job.name,
-                venue: prepared.job.venue,
-                date: targetDate || 'Unknown',
-                reason,
-                attemptsCount: result.value.attempts.length,
-              }).catch((err) => {
-                log.warn('Failed to send failure notification', {
-                  error: err instanceof Error ? err.message : String(err),
+                status: result.value.status,
+              });
+
+              // Send failure notification for meaningful failures
+              if (result.value.status !== 'success' && isNotificationConfigured()) {
+                const targetDate = getTargetDate(prepared.job);
+                const reason =
+                  result.value.errorMessage ||
+                  'Courts were available but booking failed';
+
+                void notifyBookingFailure({
+                  jobName: prepared.job.name,
+                  venue: prepared.job.venue,
+                  date: targetDate || 'Unknown',
+                  reason,
+                  attemptsCount: result.value.attempts.length,
+                }).catch((err) => {
+                  log.warn('Failed to send failure notification', {
+                    error: err instanceof Error ? err.message : String(err),
+                  });
                 });
+              }
+            } catch (error) {
+              log.error('Failed to record run history', {
+                jobName: prepared.job.name,
+                error: error instanceof Error ? error.message : String(error),
               });
             }
-          } catch (error) {
-            log.error('Failed to record run history', {
-              jobName: prepared.job.name,
-              error: error instanceof Error ? error.message : String(error),
-            });
           }
+        } else {
+          log.error('Job execution rejected', {
+            jobName: prepared.job.name,
+            reason: result.reason instanceof Error ? result.reason.message : String(result.reason),
+          });
         }
-      } else {
-        log.error('Job execution rejected', {
-          jobName: prepared.job.name,
-          reason: result.reason instanceof Error ? result.reason.message : String(result.reason),
-        });
-      }
-    }
+      })
+    );
 
     // Clear prepared jobs
     this.preparedJobs.clear();
@@ -487,7 +614,9 @@ export class NoonModeHandler {
    */
   private async executeJob(
     prepared: PreparedJob,
-    lockManager: LockManager
+    lockManager: LockManager,
+    windowSignal: WindowSignal,
+    pendingRecords: Array<() => Promise<void>>
   ): Promise<JobResult> {
     const lockKey = `${prepared.job.accountId}-${prepared.job.venue}-${prepared.targetDate}`;
     const jobStartTime = Date.now();
@@ -495,7 +624,8 @@ export class NoonModeHandler {
 
     // Retry config for window not open - keep retrying same court until window opens
     const MAX_WINDOW_RETRY_MS = 15000; // 15 seconds max
-    const WINDOW_RETRY_DELAY_MS = 500; // 500ms between retries
+    const WINDOW_RETRY_DELAY_MS = 500; // 500ms between attempt starts (steady cadence)
+    const WINDOW_MAX_IN_FLIGHT = 2; // Overlap at most two attempts when a response outlasts the cadence
 
     // Attempt to acquire lock (no logging in critical path)
     if (!lockManager.acquire(lockKey, prepared.job.id)) {
@@ -511,26 +641,8 @@ export class NoonModeHandler {
     }
 
     try {
-      // Get first available court to use for window-open detection
-      let firstCourtId: number | null = null;
-      let firstTimeSlot: string | null = null;
-      let firstDuration: number | null = null;
-
-      for (const duration of prepared.durations) {
-        for (const timeSlot of prepared.timeSlots) {
-          const key = `${timeSlot}-${duration}`;
-          const courtIds = prepared.courtAvailability.get(key) || [];
-          if (courtIds.length > 0) {
-            firstCourtId = courtIds[0];
-            firstTimeSlot = timeSlot;
-            firstDuration = duration;
-            break;
-          }
-        }
-        if (firstCourtId) break;
-      }
-
-      if (!firstCourtId || !firstTimeSlot || !firstDuration) {
+      // Court to use for window-open detection (chosen during prepare)
+      if (!prepared.firstChoice) {
         log.warn('No courts available in pre-fetch', { jobName: prepared.job.name });
         return {
           jobId: prepared.job.id,
@@ -538,6 +650,7 @@ export class NoonModeHandler {
           attempts: [],
         };
       }
+      const { timeSlot: firstTimeSlot, duration: firstDuration, courtId: firstCourtId } = prepared.firstChoice;
 
       // Helper to book with pre-fetched form or fallback to slow path
       const bookWithForm = async (
@@ -545,7 +658,7 @@ export class NoonModeHandler {
         duration: number,
         courtId: number
       ) => {
-        const formKey = `${timeSlot}-${duration}-${courtId}`;
+        const formKey = `${timeSlot}-${duration}`;
         const preFetchedForm = prepared.preFetchedForms.get(formKey);
         const bookingParams = {
           date: prepared.targetDate,
@@ -563,15 +676,60 @@ export class NoonModeHandler {
         }
       };
 
+      // Record a successful attempt and build the job result (shared by both phases)
+      const succeed = (attempt: BookingAttempt, result: BookingResult): JobResult => {
+        log.info('BOOKING SUCCESS!', {
+          jobName: prepared.job.name,
+          date: attempt.date,
+          timeSlot: attempt.timeSlot,
+          duration: attempt.duration,
+          courtId: attempt.courtId,
+          totalAttempts: attempts.length,
+          windowRetries: windowRetryCount,
+          durationMs: Date.now() - jobStartTime,
+        });
+
+        pendingRecords.push(() => this.handleSuccessfulBooking(prepared, attempt, result));
+
+        return {
+          jobId: prepared.job.id,
+          status: 'success',
+          attempts,
+          courtId: attempt.courtId,
+          date: attempt.date,
+          startTime: attempt.timeSlot,
+          duration: attempt.duration,
+        };
+      };
+
       // Phase 1: Wait for booking window to open by retrying first court
-      let windowOpen = false;
+      // Attempts start on a steady cadence even while a slow response is still outstanding
+      // (up to WINDOW_MAX_IN_FLIGHT at once), so server lag doesn't delay the first attempt after the open
+      let windowState = 'waiting' as WindowState;
+      let windowSuccess: { attempt: BookingAttempt; result: BookingResult } | undefined;
+      let windowError: unknown;
       let windowRetryCount = 0;
-      const windowStartTime = Date.now();
-
-      while (!windowOpen && (Date.now() - windowStartTime) < MAX_WINDOW_RETRY_MS) {
-        const result = await bookWithForm(firstTimeSlot, firstDuration, firstCourtId);
+      const advanceWindow = (next: WindowState): boolean => {
+        if (WINDOW_STATE_ORDER.indexOf(next) <= WINDOW_STATE_ORDER.indexOf(windowState)) return false;
+        windowState = next;
+        return true;
+      };
+      const inFlight = new Set<Promise<void>>();
+      const windowStartTime = performance.now(); // Monotonic: immune to clock adjustments
+      const windowDeadline = windowStartTime + MAX_WINDOW_RETRY_MS;
+      let nextAttemptTime = windowStartTime;
+      let sawWindowSignal = false;
+
+      const runWindowAttempt = async (): Promise<void> => {
+        let result: BookingResult;
+        try {
+          result = await bookWithForm(firstTimeSlot, firstDuration, firstCourtId);
+        } catch (error) {
+          if (advanceWindow('failed')) windowError = error;
+          return;
+        }
 
-        attempts.push({
+        const attempt: BookingAttempt = {
           date: prepared.targetDate,
           timeSlot: firstTimeSlot,
           duration: firstDuration,
@@ -581,32 +739,13 @@ export class NoonModeHandler {
           timestamp: new Date(),
           externalId: result.externalId,
           confirmationNumber: result.confirmationNumber,
-        });
+        };
+        attempts.push(attempt);
 
         if (result.success) {
-          // SUCCESS on first try!
-          log.info('BOOKING SUCCESS!', {
-            jobName: prepared.job.name,
-            date: prepared.targetDate,
-            timeSlot: firstTimeSlot,
-            duration: firstDuration,
-            courtId: firstCourtId,
-            totalAttempts: attempts.length,
-            windowRetries: windowRetryCount,
-            durationMs: Date.now() - jobStartTime,
-          });
-
-          await this.handleSuccessfulBooking(prepared, attempts[attempts.length - 1], result);
-
-          return {
-            jobId: prepared.job.id,
-            status: 'success',
-            attempts,
-            courtId: firstCourtId,
-            date: prepared.targetDate,
-            startTime: firstTimeSlot,
-            duration: firstDuration,
-          };
+          if (advanceWindow('booked')) windowSuccess = { attempt, result };
+          windowSignal.open();
+          return;
         }
 
         // Check if window not open
@@ -615,36 +754,74 @@ export class NoonModeHandler {
           log.info('Booking window not open yet - retrying', {
             jobName: prepared.job.name,
             retryCount: windowRetryCount,
-            elapsedMs: Date.now() - windowStartTime,
+            elapsedMs: Math.round(performance.now() - windowStartTime),
             maxMs: MAX_WINDOW_RETRY_MS,
             message: result.message,
           });
-          await new Promise(resolve => setTimeout(resolve, WINDOW_RETRY_DELAY_MS));
-          continue;
+          return;
         }
 
         // Window is open but court taken - move to phase 2
-        windowOpen = true;
-        log.info('Booking window is open, court taken - trying other courts', {
-          jobName: prepared.job.name,
-          windowRetries: windowRetryCount,
-          elapsedMs: Date.now() - windowStartTime,
-        });
+        windowSignal.open();
+        if (advanceWindow('open')) {
+          log.info('Booking window is open, court taken - trying other courts', {
+            jobName: prepared.job.name,
+            windowRetries: windowRetryCount,
+            elapsedMs: Math.round(performance.now() - windowStartTime),
+          });
+        }
+      };
+
+      // One monotonic clock read per pass, compared against precomputed deadlines
+      let now = windowStartTime;
+      while (windowState === 'waiting' && now < windowDeadline) {
+        // Another job saw the window open: retry now instead of waiting out the cadence
+        if (windowSignal.isOpen && !sawWindowSignal) {
+          sawWindowSignal = true;
+          nextAttemptTime = now;
+        }
+
+        if (inFlight.size < WINDOW_MAX_IN_FLIGHT && now >= nextAttemptTime) {
+          nextAttemptTime = now + WINDOW_RETRY_DELAY_MS;
+          const pending: Promise<void> = runWindowAttempt().finally(() => inFlight.delete(pending));
+          inFlight.add(pending);
+          now = performance.now();
+          continue;
+        }
+
+        // Wake on whichever comes first: a response, the next cadence tick, or the window opening
+        const wakeups: Promise<unknown>[] = [...inFlight];
+        if (inFlight.size < WINDOW_MAX_IN_FLIGHT) {
+          wakeups.push(sleepUntilMonotonic(Math.min(nextAttemptTime, windowDeadline)));
+        }
+        if (!sawWindowSignal) {
+          wakeups.push(windowSignal.opened);
+        }
+        await Promise.race(wakeups);
+        now = performance.now();
       }
 
-      // Check if we timed out waiting for window
-      if (!windowOpen && (Date.now() - windowStartTime) >= MAX_WINDOW_RETRY_MS) {
-        log.warn('Booking window still not open after max time', {
-          jobName: prepared.job.name,
-          totalRetries: windowRetryCount,
-          elapsedMs: Date.now() - windowStartTime,
-        });
-        return {
-          jobId: prepared.job.id,
-          status: 'window_closed',
-          attempts,
-          errorMessage: `Booking window not open after ${windowRetryCount} retries (${Math.round((Date.now() - windowStartTime) / 1000)}s)`,
-        };
+      // Let outstanding attempts land so a late success isn't lost
+      await Promise.all(inFlight);
+
+      switch (windowState) {
+        case 'booked':
+          return succeed(windowSuccess!.attempt, windowSuccess!.result);
+        case 'failed':
+          throw windowError;
+        case 'waiting':
+          log.warn('Booking window still not open after max time', {
+            jobName: prepared.job.name,
+            totalRetries: windowRetryCount,
+            elapsedMs: Math.round(performance.now() - windowStartTime),
+          });
+          return {
+            jobId: prepared.job.id,
+            status: 'window_closed',
+            attempts,
+            errorMessage: `Booking window not open after ${windowRetryCount} retries (${Math.round((performance.now() - windowStartTime) / 1000)}s)`,
+          };
+        // 'open': the window opened but the first court was taken
       }
 
       // Phase 2: Window is open - try all courts/slots
@@ -664,7 +841,7 @@ export class NoonModeHandler {
 
             const result = await bookWithForm(timeSlot, duration, courtId);
 
-            attempts.push({
+            const attempt: BookingAttempt = {
               date: prepared.targetDate,
               timeSlot,
               duration,
@@ -674,31 +851,11 @@ export class NoonModeHandler {
               timestamp: new Date(),
               externalId: result.externalId,
               confirmationNumber: result.confirmationNumber,
-            });
+            };
+            attempts.push(attempt);
 
             if (result.success) {
-              log.info('BOOKING SUCCESS!', {
-                jobName: prepared.job.name,
-                date: prepared.targetDate,
-                timeSlot,
-                duration,
-                courtId,
-                totalAttempts: attempts.length,
-                windowRetries: windowRetryCount,
-                durationMs: Date.now() - jobStartTime,
-              });
-
-              await this.handleSuccessfulBooking(prepared, attempts[attempts.length - 1], result);
-
-              return {
-                jobId: prepared.job.id,
-                status: 'success',
-                attempts,
-                courtId,
-                date: prepared.targetDate,
-                startTime: timeSlot,
-                duration,
-              };
+              return succeed(attempt, result);
             }
             // Court taken - immediately try next court (no delay)
           }
@@ -768,15 +925,6 @@ export class NoonModeHandler {
     }
   }
 
-  /**
-   * Flush deferred logs (called after booking completes)
-   */
-  private flushLogs(logs: Array<{ level: 'info' | 'warn' | 'debug' | 'error'; msg: string; data: object }>): void {
-    for (const { level, msg, data } of logs) {
-      log[level](msg, data);
-    }
-  }
-
   /**
    * Get number of prepared jobs
    */
@@ -3,7 +3,13 @@
  * With extensive logging for debugging
  */
 
-import { CourtReserveClient, generateTimeSlots, generateDurations } from '../courtreserve';
+import {
+  CourtReserveClient,
+  generateTimeSlots,
+  generateDurations,
+  warmConnections,
+  Court,
+} from '../courtreserve';
 import { LockManager } from './lock-manager';
 import { JobResult, BookingAttempt, JobWithAccount } from './types';
 import {
@@ -23,6 +29,31 @@ import { createLogger } from '../logger';
 const log = createLogger('Scheduler:PollingMode');
 
 const DELAY_BETWEEN_JOBS_MS = 2000; // 2 seconds between jobs
+const MS_PER_HOUR = 60 * 60 * 1000;
+const SESSION_MAX_AGE_MS = 30 * 60 * 1000; // Reuse a login across polls for this long
+const MAX_PARALLEL_ACCOUNTS = 3; // Accounts polled at once; the rest wait for a free worker
+const LOGIN_FAILURE_THRESHOLD = 3; // Consecutive failed logins before logins are paused
+const LOGIN_COOLDOWN_MS = 60 * 60 * 1000; // First pause; doubles with each failed retry
+const MAX_LOGIN_COOLDOWN_MS = 6 * 60 * 60 * 1000;
+const PACIFIC_CLOCK = new Intl.DateTimeFormat('en-US', {
+  timeZone: 'America/Los_Angeles',
+  hour: 'numeric',
+  minute: 'numeric',
+  hourCycle: 'h23',
+}); // Noon window is defined on the Pacific clock, like the cron schedules
+
+/**
+ * Get the Pacific wall-clock hour and minute, regardless of the server's timezone
+ */
+function getPacificClock(now: Date): { hour: number; minute: number } {
+  let hour = 0;
+  let minute = 0;
+  for (const part of PACIFIC_CLOCK.formatToParts(now)) {
+    if (part.type === 'hour') hour = Number(part.value);
+    else if (part.type === 'minute') minute = Number(part.value);
+  }
+  return { hour, minute };
+}
 
 /**
  * Sleep for specified milliseconds
@@ -31,7 +62,24 @@ function sleep(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
+interface CachedSession {
+  client: CourtReserveClient;
+  loggedInAt: number;
+}
+
+interface LoginFailures {
+  count: number; // Consecutive failures
+  retryAt: number; // No login attempts before this (epoch ms); 0 = not paused
+}
+
 export class PollingModeHandler {
+  // Logged-in clients kept between runs (key: "accountId-venue"), so a poll skips the login
+  // round trips while the session is young; dropped on any job error so the next run logs in fresh
+  private sessionCache = new Map<string, CachedSession>();
+  // Circuit breaker per "accountId-venue": after repeated failed logins (bad password, blocked IP)
+  // further logins wait out a growing cooldown instead of hitting the login page every poll
+  private loginFailures = new Map<string, LoginFailures>();
+
   constructor() {
     log.debug('PollingModeHandler initialized', { delayBetweenJobsMs: DELAY_BETWEEN_JOBS_MS });
   }
@@ -41,9 +89,9 @@ export class PollingModeHandler {
    * Runs every 15 minutes, skips noon window (11:55-12:15)
    */
   async execute(lockManager: LockManager): Promise<JobResult[]> {
+    // Noon mode sleeps straight through to the 12:00 boundary; polling stays out of its way
     const now = new Date();
-    const hour = now.getHours();
-    const minute = now.getMinutes();
+    const { hour, minute } = getPacificClock(now);
 
     log.trace('Checking noon window', { hour, minute });
 
@@ -71,92 +119,39 @@ export class PollingModeHandler {
         return [];
       }
 
-      const results: JobResult[] = [];
-
-      // Process jobs sequentially with delays (less aggressive than noon mode)
-      for (let i = 0; i < jobs.length; i++) {
-        const job = jobs[i];
-        const jobStartTime = new Date();
-        try {
-          log.debug('Processing job', {
-            index: i + 1,
-            total: jobs.length,
-            jobName: job.name,
-          });
-
-          const result = await this.processJob(job, lockManager);
-          results.push(result);
-
-          log.debug('Job processing complete', {
-            jobName: job.name,
-            status: result.status,
-            attemptsCount: result.attempts.length,
-          });
-
-          // Update last attempt with result details (always, even for non-meaningful events)
-          await updateLastAttempt(job.id, result, result.date);
-
-          // Record history if meaningful
-          if (shouldRecordHistory(result, 'polling')) {
-            try {
-              await recordRunHistory(
-                job.id,
-                'polling',
-                result,
-                jobStartTime,
-                new Date()
-              );
-              log.debug('Run history recorded', {
-                jobName: job.name,
-                status: result.status,
-              });
-
-              // Send failure notification for meaningful failures
-              if (result.status !== 'success' && isNotificationConfigured()) {
-                const targetDates = getTargetDates(job);
-                const reason =
-                  result.errorMessage ||
-                  'Courts were available but booking failed';
+      // Open pooled connections to every CourtReserve host before the accounts start in parallel
+      await warmConnections();
+
+      // Jobs for different accounts run in parallel (independent sessions, at most
+      // MAX_PARALLEL_ACCOUNTS at a time); jobs sharing an account stay sequential with delays
+      // (less aggressive than noon mode)
+      const jobsByAccount = new Map<string, JobWithAccount[]>();
+      for (const job of jobs) {
+        const accountJobs = jobsByAccount.get(job.accountId) || [];
+        accountJobs.push(job);
+        jobsByAccount.set(job.accountId, accountJobs);
+      }
 
-                await notifyBookingFailure({
-                  jobName: job.name,
-                  venue: job.venue,
-                  date: targetDates[0] || 'Unknown',
-                  reason,
-                  attemptsCount: result.attempts.length,
-                }).catch((err) => {
-                  log.warn('Failed to send failure notification', {
-                    error: err instanceof Error ? err.message : String(err),
-                  });
-                });
-              }
-            } catch (error) {
-              log.error('Failed to record run history', {
-                jobName: job.name,
-                error: error instanceof Error ? error.message : String(error),
-              });
-            }
-          }
+      const accountGroups = Array.from(jobsByAccount.values());
+      const workerCount = Math.min(MAX_PARALLEL_ACCOUNTS, accountGroups.length);
+      log.debug('Processing accounts in parallel', {
+        accountCount: accountGroups.length,
+        jobCount: jobs.length,
+        workerCount,
+      });
 
-          // Delay between jobs to avoid rate limiting
-          if (i < jobs.length - 1) {
-            log.trace('Sleeping between jobs', { delayMs: DELAY_BETWEEN_JOBS_MS });
-            await sleep(DELAY_BETWEEN_JOBS_MS);
+      // A fixed set of workers pulls the next account as soon as it finishes one
+      const accountResults: JobResult[][] = new Array(accountGroups.length);
+      let nextAccount = 0;
+      await Promise.all(
+        Array.from({ length: workerCount }, async () => {
+          while (nextAccount < accountGroups.length) {
+            const index = nextAccount++;
+            accountResults[index] = await this.processAccountJobs(accountGroups[index], lockManager);
           }
-        } catch (error) {
-          log.error('Error processing job', {
-            jobName: job.name,
-            error: error instanceof Error ? error.message : String(error),
-            stack: error instanceof Error ? error.stack : undefined,
-          });
-          results.push({
-            jobId: job.id,
-            status: 'error',
-            attempts: [],
-            errorMessage: error instanceof Error ? error.message : String(error),
-          });
-        }
-      }
+        })
+      );
+      const results = accountResults.flat();
 
       const pollingTime = Date.now() - pollingStartTime;
       const successCount = results.filter((r) => r.status === 'success').length;
@@ -182,22 +177,168 @@ export class PollingModeHandler {
   }
 
   /**
-   * Process a single job
+   * Process all jobs belonging to one account sequentially, with delays between jobs
    */
-  private async processJob(
-    job: JobWithAccount,
+  private async processAccountJobs(
+    jobs: JobWithAccount[],
     lockManager: LockManager
-  ): Promise<JobResult> {
-    const jobStartTime = Date.now();
+  ): Promise<JobResult[]> {
+    const results: JobResult[] = [];
 
-    log.info('Processing job', {
-      jobId: job.id,
-      jobName: job.name,
-      venue: job.venue,
-      recurrence: job.recurrence,
-    });
+    // One login per venue for this account, shared by all of its jobs (saves a GET + POST per job)
+    const sessions = new Map<string, CourtReserveClient | null>();
+
+    for (let i = 0; i < jobs.length; i++) {
+      const job = jobs[i];
+      const jobStartTime = new Date();
+      try {
+        log.debug('Processing job', {
+          index: i + 1,
+          total: jobs.length,
+          jobName: job.name,
+        });
+
+        if (!sessions.has(job.venue)) {
+          sessions.set(job.venue, await this.getSession(job));
+        }
+        const result = await this.processJob(job, sessions.get(job.venue) ?? null, lockManager);
+        results.push(result);
+
+        if (result.status === 'error') {
+          this.sessionCache.delete(`${job.accountId}-${job.venue}`);
+        }
+
+        log.debug('Job processing complete', {
+          jobName: job.name,
+          status: result.status,
+          attemptsCount: result.attempts.length,
+        });
+
+        // Update last attempt with result details (always, even for non-meaningful events)
+        await updateLastAttempt(job.id, result, result.date);
+
+        // Record history if meaningful
+        if (shouldRecordHistory(result, 'polling')) {
+          try {
+            await recordRunHistory(
+              job.id,
+              'polling',
+              result,
+              jobStartTime,
+              new Date()
+            );
+            log.debug('Run history recorded', {
+              jobName: job.name,
+              status: result.status,
+            });
+
+            // Send failure notification for meaningful failures
+            if (result.status !== 'success' && isNotificationConfigured()) {
+              const targetDates = getTargetDates(job);
+              const reason =
+                result.errorMessage ||
+                'Courts were available but booking failed';
+
+              void notifyBookingFailure({
+                jobName: job.name,
+                venue: job.venue,
+                date: targetDates[0] || 'Unknown',
+                reason,
+                attemptsCount: result.attempts.length,
+              }).catch((err) => {
+                log.warn('Failed to send failure notification', {
+                  error: err instanceof Error ? err.message : String(err),
+                });
+              });
+            }
+          } catch (error) {
+            log.error('Failed to record run history', {
+              jobName: job.name,
+              error: error instanceof Error ? error.message : String(error),
+            });
+          }
+        }
+
+        // Delay between jobs to avoid rate limiting (a job that sent no requests, e.g. every date
+        // maxed out or locked, has nothing to space out)
+        if (i < jobs.length - 1 && result.sentRequests) {
+          log.trace('Sleeping between jobs', { delayMs: DELAY_BETWEEN_JOBS_MS });
+          await sleep(DELAY_BETWEEN_JOBS_MS);
+        }
+      } catch (error) {
+        log.error('Error processing job', {
+          jobName: job.name,
+          error: error instanceof Error ? error.message : String(error),
+          stack: error instanceof Error ? error.stack : undefined,
+        });
+        results.push({
+          jobId: job.id,
+          status: 'error',
+          attempts: [],
+          errorMessage: error instanceof Error ? error.message : String(error),
+        });
+      }
+    }
+
+    return results;
+  }
+
+  /**
+   * Get a logged-in client for a job's account and venue, reusing a recent session
+   * Returns null if login fails or logins for the account are paused
+   */
+  private async getSession(job: JobWithAccount): Promise<CourtReserveClient | null> {
+    const key = `${job.accountId}-${job.venue}`;
+    const cached = this.sessionCache.get(key);
+    if (cached && cached.client.isLoggedIn() && Date.now() - cached.loggedInAt < SESSION_MAX_AGE_MS) {
+      log.debug('Reusing session from previous poll', {
+        jobName: job.name,
+        sessionAgeMs: Date.now() - cached.loggedInAt,
+      });
+      return cached.client;
+    }
+
+    this.sessionCache.delete(key);
+
+    const failures = this.loginFailures.get(key);
+    if (failures && Date.now() < failures.retryAt) {
+      log.warn('Skipping login - paused after repeated failures', {
+        jobName: job.name,
+        failures: failures.count,
+        retryInMinutes: Math.ceil((failures.retryAt - Date.now()) / 60000),
+      });
+      return null;
+    }
+
+    const client = await this.authenticate(job);
+    if (client) {
+      this.loginFailures.delete(key);
+      this.sessionCache.set(key, { client, loggedInAt: Date.now() });
+      return client;
+    }
 
-    // Create and authenticate client
+    // Once past the threshold, each failed retry doubles the pause
+    const count = (failures?.count ?? 0) + 1;
+    let retryAt = 0;
+    if (count >= LOGIN_FAILURE_THRESHOLD) {
+      const cooldownMs = Math.min(MAX_LOGIN_COOLDOWN_MS, LOGIN_COOLDOWN_MS * 2 ** (count - LOGIN_FAILURE_THRESHOLD));
+      retryAt = Date.now() + cooldownMs;
+      log.warn('Pausing logins after repeated failures', {
+        jobName: job.name,
+        email: job.account.email,
+        failures: count,
+        cooldownMinutes: cooldownMs / 60000,
+      });
+    }
+    this.loginFailures.set(key, { count, retryAt });
+    return null;
+  }
+
+  /**
+   * Create and authenticate a client for a job's account and venue
+   * Returns null if login fails
+   */
+  private async authenticate(job: JobWithAccount): Promise<CourtReserveClient | null> {
     log.debug('Creating CourtReserve client', {
       jobName: job.name,
       venue: job.venue,
@@ -217,12 +358,98 @@ export class PollingModeHandler {
         jobName: job.name,
         loginDurationMs: Date.now() - loginStartTime,
       });
+      return client;
     } catch (error) {
       log.error('Authentication failed', {
         jobName: job.name,
         email: job.account.email,
         error: error instanceof Error ? error.message : String(error),
       });
+      return null;
+    }
+  }
+
+  /**
+   * Parse a job's time/duration preferences (new or old schema) into slots and durations to try
+   * Returns null if the old-schema JSON is invalid
+   */
+  private parsePreferences(job: JobWithAccount): { timeSlots: string[]; durations: number[] } | null {
+    let preferredTime: string;
+    let timeFlexibility: number;
+    let preferredDuration: number;
+    let minDuration: number;
+    let strictDuration: boolean;
+
+    const hasNewSchema = 'preferredTime' in job && job.preferredTime !== null;
+    if (hasNewSchema) {
+      preferredTime = job.preferredTime!;
+      timeFlexibility = (job.timeFlexibility as number) ?? 30;
+      preferredDuration = (job.preferredDuration as number) ?? 120;
+      minDuration = (job.minDuration as number) ?? 60;
+      strictDuration = (job.strictDuration as boolean) ?? false;
+    } else {
+      // Fallback to old schema
+      try {
+        const timeSlots = job.timeSlots ? JSON.parse(job.timeSlots) as string[] : ['18:00'];
+        const durations = job.durations ? JSON.parse(job.durations) as number[] : [120, 90, 60, 30];
+
+        preferredTime = timeSlots[0] || '18:00';
+        timeFlexibility = timeSlots.length > 1 ? 30 : 0;
+        preferredDuration = durations[0] || 120;
+        minDuration = durations[durations.length - 1] || 60;
+        strictDuration = durations.length === 1;
+
+        log.trace('Parsed old schema preferences', {
+          jobName: job.name,
+          preferredTime,
+          timeFlexibility,
+          preferredDuration,
+          minDuration,
+          strictDuration,
+        });
+      } catch (error) {
+        log.error('Failed to parse job preferences (old schema)', {
+          jobName: job.name,
+          timeSlots: job.timeSlots,
+          durations: job.durations,
+          error: error instanceof Error ? error.message : String(error),
+        });
+        return null;
+      }
+    }
+
+    // Generate time slots and durations
+    const timeSlots = generateTimeSlots(preferredTime, timeFlexibility);
+    const durations = generateDurations(preferredDuration, minDuration, strictDuration);
+
+    log.debug('Generated slots and durations', {
+      jobName: job.name,
+      timeSlots,
+      durations,
+      totalCombinations: timeSlots.length * durations.length,
+    });
+
+    return { timeSlots, durations };
+  }
+
+  /**
+   * Process a single job
+   */
+  private async processJob(
+    job: JobWithAccount,
+    client: CourtReserveClient | null,
+    lockManager: LockManager
+  ): Promise<JobResult> {
+    const jobStartTime = Date.now();
+
+    log.info('Processing job', {
+      jobId: job.id,
+      jobName: job.name,
+      venue: job.venue,
+      recurrence: job.recurrence,
+    });
+
+    if (!client) {
       return {
         jobId: job.id,
         status: 'error',
@@ -241,29 +468,50 @@ export class PollingModeHandler {
 
     const attempts: BookingAttempt[] = [];
 
-    // Process each target date
-    for (const targetDate of targetDates) {
-      log.debug('Processing target date', { jobName: job.name, targetDate });
+    // Preferences don't depend on the date, so they are parsed once per job
+    const preferences = this.parsePreferences(job);
+    if (!preferences) {
+      return {
+        jobId: job.id,
+        status: 'error',
+        attempts: [],
+        errorMessage: 'Invalid job preferences',
+      };
+    }
+    const { timeSlots, durations } = preferences;
 
-      // Check max bookings per day
-      const maxBookingsPerDay = ('maxBookingsPerDay' in job && job.maxBookingsPerDay) || 1;
-      const existingCount = await countExistingBookings(job.accountId, job.venue, targetDate);
+    const maxBookingsPerDay = ('maxBookingsPerDay' in job && job.maxBookingsPerDay) || 1;
 
-      log.trace('Checking existing bookings', {
-        jobName: job.name,
-        targetDate,
-        existingCount,
-        maxBookingsPerDay,
-      });
+    // Get minimum notice hours (default 6 if not set)
+    const minNoticeHours = ('minNoticeHours' in job && typeof job.minNoticeHours === 'number')
+      ? job.minNoticeHours
+      : 6;
+
+    // Dates are independent, so check existing bookings for all of them at once and start every
+    // lockable date's availability lookup together: the slowest response sets the wait, not the sum.
+    // One ReadConsolidated request per date covers every slot/duration combination.
+    const existingCounts = await Promise.all(
+      targetDates.map((targetDate) => countExistingBookings(job.accountId, job.venue, targetDate))
+    );
+    log.trace('Checked existing bookings', {
+      jobName: job.name,
+      targetDates,
+      existingCounts,
+      maxBookingsPerDay,
+    });
 
-      if (existingCount >= maxBookingsPerDay) {
+    // Locks are taken before any lookup, so a date another job is already booking costs no request
+    const availabilityLookups = new Map<string, Promise<Map<string, Court[]>>>();
+    const heldLocks: string[] = [];
+    targetDates.forEach((targetDate, i) => {
+      if (existingCounts[i] >= maxBookingsPerDay) {
         log.info('Max bookings reached for date - skipping', {
           jobName: job.name,
           targetDate,
-          existingCount,
+          existingCount: existingCounts[i],
           maxBookingsPerDay,
         });
-        continue;
+        return;
       }
 
       // Try to acquire lock
@@ -274,76 +522,39 @@ export class PollingModeHandler {
           targetDate,
           lockKey,
         });
-        continue;
+        return;
       }
-
       log.trace('Lock acquired', { jobName: job.name, lockKey });
+      heldLocks.push(lockKey);
 
-      try {
-        // Parse preferences (handle both old and new schema formats)
-        let preferredTime: string;
-        let timeFlexibility: number;
-        let preferredDuration: number;
-        let minDuration: number;
-        let strictDuration: boolean;
-
-        const hasNewSchema = 'preferredTime' in job && job.preferredTime !== null;
-        if (hasNewSchema) {
-          preferredTime = job.preferredTime!;
-          timeFlexibility = (job.timeFlexibility as number) ?? 30;
-          preferredDuration = (job.preferredDuration as number) ?? 120;
-          minDuration = (job.minDuration as number) ?? 60;
-          strictDuration = (job.strictDuration as boolean) ?? false;
-        } else {
-          // Fallback to old schema
-          try {
-            const timeSlots = job.timeSlots ? JSON.parse(job.timeSlots) as string[] : ['18:00'];
-            const durations = job.durations ? JSON.parse(job.durations) as number[] : [120, 90, 60, 30];
-
-            preferredTime = timeSlots[0] || '18:00';
-            timeFlexibility = timeSlots.length > 1 ? 30 : 0;
-            preferredDuration = durations[0] || 120;
-            minDuration = durations[durations.length - 1] || 60;
-            strictDuration = durations.length === 1;
-
-            log.trace('Parsed old schema preferences', {
-              jobName: job.name,
-              preferredTime,
-              timeFlexibility,
-              preferredDuration,
-              minDuration,
-              strictDuration,
-            });
-          } catch (error) {
-            log.error('Failed to parse job preferences (old schema)', {
-              jobName: job.name,
-              timeSlots: job.timeSlots,
-              durations: job.durations,
-              error: error instanceof Error ? error.message : String(error),
-            });
-            lockManager.release(lockKey, job.id);
-            continue;
-          }
-        }
-
-        // Generate time slots and durations
-        const timeSlots = generateTimeSlots(preferredTime, timeFlexibility);
-        const durations = generateDurations(preferredDuration, minDuration, strictDuration);
-
-        log.debug('Generated slots and durations', {
-          jobName: job.name,
-          targetDate,
-          timeSlots,
-          durations,
-          totalCombinations: timeSlots.length * durations.length,
-        });
+      const lookup = client.getCourtAvailability(targetDate, timeSlots, durations);
+      lookup.catch(() => {
+        // Errors are handled where the lookup is awaited; the session may have expired,
+        // so the next run logs in fresh
+        this.sessionCache.delete(`${job.accountId}-${job.venue}`);
+      });
+      availabilityLookups.set(targetDate, lookup);
+    });
 
-        // Get minimum notice hours (default 6 if not set)
-        const minNoticeHours = ('minNoticeHours' in job && typeof job.minNoticeHours === 'number')
-          ? job.minNoticeHours
-          : 6;
+    // Bookings only follow a lookup, so a job that started none sent nothing
+    const sentRequests = availabilityLookups.size > 0;
 
-        // Try slots SEQUENTIALLY (less aggressive than noon mode)
+    try {
+      // Process each locked target date
+      for (const [targetDate, availabilityLookup] of availabilityLookups) {
+        log.debug('Processing target date', { jobName: job.name, targetDate });
+
+        // Slot start times don't depend on the duration, so notice is computed once per slot
+        // from a single clock reading
+        const checkedAt = Date.now();
+        const hoursUntilSlots = new Map(
+          timeSlots.map((timeSlot) => [
+            timeSlot,
+            (new Date(`${targetDate}T${timeSlot}:00`).getTime() - checkedAt) / MS_PER_HOUR,
+          ])
+        );
+
+        // Try bookings SEQUENTIALLY (less aggressive than noon mode)
         let booked = false;
         for (const duration of durations) {
           if (booked) break;
@@ -352,15 +563,15 @@ export class PollingModeHandler {
             if (booked) break;
 
             // Check minimum notice requirement
-            const slotDateTime = new Date(`${targetDate}T${timeSlot}:00`);
-            const hoursUntilSlot = (slotDateTime.getTime() - Date.now()) / (1000 * 60 * 60);
+            const hoursUntilSlot = hoursUntilSlots.get(timeSlot)!;
 
             if (hoursUntilSlot < minNoticeHours) {
+              const hoursUntilSlotText = hoursUntilSlot.toFixed(1);
               log.debug('Skipping slot - insufficient notice', {
                 jobName: job.name,
                 targetDate,
                 timeSlot,
-                hoursUntilSlot: hoursUntilSlot.toFixed(1),
+                hoursUntilSlot: hoursUntilSlotText,
                 minNoticeHours,
               });
               attempts.push({
@@ -368,7 +579,7 @@ export class PollingModeHandler {
                 timeSlot,
                 duration,
                 success: false,
-                message: `Insufficient notice (${hoursUntilSlot.toFixed(1)}h < ${minNoticeHours}h)`,
+                message: `Insufficient notice (${hoursUntilSlotText}h < ${minNoticeHours}h)`,
                 timestamp: new Date(),
               });
               continue;
@@ -376,7 +587,7 @@ export class PollingModeHandler {
 
             try {
               // Check availability
-              const courts = await client.getAvailableCourts(targetDate, timeSlot, duration);
+              const courts = (await availabilityLookup).get(`${timeSlot}-${duration}`) ?? [];
 
               if (courts.length === 0) {
                 attempts.push({
@@ -458,9 +669,7 @@ export class PollingModeHandler {
 
                 booked = true;
 
-                // Return early on successful booking
-                log.trace('Releasing lock after success', { lockKey });
-                lockManager.release(lockKey, job.id);
+                // Return early on successful booking (the finally below releases the locks)
                 return {
                   jobId: job.id,
                   status: 'success',
@@ -469,6 +678,7 @@ export class PollingModeHandler {
                   date: attempt.date,
                   startTime: attempt.timeSlot,
                   duration: attempt.duration,
+                  sentRequests,
                 };
               } else {
                 log.debug('Booking attempt failed', {
@@ -490,7 +700,9 @@ export class PollingModeHandler {
             }
           }
         }
-      } finally {
+      }
+    } finally {
+      for (const lockKey of heldLocks) {
         lockManager.release(lockKey, job.id);
       }
     }
@@ -506,6 +718,7 @@ export class PollingModeHandler {
       status: allWindowClosed ? 'window_closed' : (attempts.length > 0 ? 'no_courts' : 'error'),
       attempts,
       errorMessage: allWindowClosed ? 'Booking window not open yet' : undefined,
+      sentRequests,
     };
   }
 }
@@ -6,8 +6,10 @@
 
 import * as cron from 'node-cron';
 import { LockManager } from './lock-manager';
+import { nearestMinuteBoundary } from './timing';
 import { NoonModeHandler } from './noon-mode';
 import { PollingModeHandler } from './polling-mode';
+import { warmConnections } from '../courtreserve';
 import { SchedulerMode, SchedulerRunResult, JobResult } from './types';
 import { notifySchedulerError, isNotificationConfigured } from '../notifications';
 import { createLogger } from '../logger';
@@ -57,7 +59,7 @@ export class SchedulerService {
           log.error('Noon preparation failed', { error: errorMessage });
 
           if (isNotificationConfigured()) {
-            await notifySchedulerError({
+            void notifySchedulerError({
               mode: 'noon',
               error: errorMessage,
             }).catch((err) => {
@@ -73,23 +75,43 @@ export class SchedulerService {
       }
     );
 
-    // Noon execution - 12:00:00 PM Pacific
+    // Connection heartbeat - 11:59:20, :30, :40 and :50 AM Pacific
+    // Prep can finish almost a minute before noon, longer than some load balancer idle timeouts;
+    // a cheap request every 10 seconds keeps the pooled connections warm for the first booking
+    // POST, stopping well clear of the window so it never competes with the race
+    log.debug('Setting up noon connection heartbeat cron job', {
+      schedule: '20,30,40,50 59 11 * * *',
+      timezone: 'America/Los_Angeles',
+    });
+    const heartbeatJob = cron.schedule(
+      '20,30,40,50 59 11 * * *',
+      async () => {
+        log.debug('=== NOON CONNECTION HEARTBEAT TRIGGERED ===');
+        await warmConnections();
+      },
+      {
+        timezone: 'America/Los_Angeles',
+      }
+    );
+
+    // Noon execution - triggered at 11:59:59 AM Pacific, then waits precisely for 12:00:00 PM
+    // (cron ticks can fire late; arming a second early lets the handler hit the boundary exactly)
     log.debug('Setting up noon execution cron job', {
-      schedule: '0 0 12 * * *',
+      schedule: '59 59 11 * * *',
       timezone: 'America/Los_Angeles',
     });
     const noonJob = cron.schedule(
-      '0 0 12 * * *',
+      '59 59 11 * * *',
       async () => {
         log.info('=== NOON EXECUTION TRIGGERED ===');
         try {
-          await this.runNoonMode();
+          await this.runNoonMode(nearestMinuteBoundary());
         } catch (error) {
           const errorMessage = error instanceof Error ? error.message : String(error);
           log.error('Noon execution failed', { error: errorMessage });
 
           if (isNotificationConfigured()) {
-            await notifySchedulerError({
+            void notifySchedulerError({
               mode: 'noon',
               error: errorMessage,
             }).catch((err) => {
@@ -121,7 +143,7 @@ export class SchedulerService {
           log.error('Polling mode failed', { error: errorMessage });
 
           if (isNotificationConfigured()) {
-            await notifySchedulerError({
+            void notifySchedulerError({
               mode: 'polling',
               error: errorMessage,
             }).catch((err) => {
@@ -137,15 +159,16 @@ export class SchedulerService {
       }
     );
 
-    this.cronJobs = [prepareJob, noonJob, pollingJob];
+    this.cronJobs = [prepareJob, heartbeatJob, noonJob, pollingJob];
 
     log.info('Scheduler started successfully', {
-      cronJobs: 3,
+      cronJobs: this.cronJobs.length,
       startTime: this.startTime.toISOString(),
     });
     log.info('Schedule:', {
       noonPreparation: '11:59:00 AM Pacific (60s before noon)',
-      noonExecution: '12:00:00 PM Pacific',
+      noonConnectionHeartbeat: '11:59:20, :30, :40, :50 AM Pacific',
+      noonExecution: '12:00:00 PM Pacific (armed at 11:59:59)',
       pollingMode: 'Every 15 minutes',
     });
   }
@@ -170,8 +193,9 @@ export class SchedulerService {
 
   /**
    * Run noon mode
+   * @param startAt - Optional wall-clock deadline (epoch ms) for the first booking attempt
    */
-  private async runNoonMode(): Promise<SchedulerRunResult> {
+  private async runNoonMode(startAt?: number): Promise<SchedulerRunResult> {
     log.info('Starting noon mode execution');
 
     if (this.isRunning) {
@@ -188,7 +212,7 @@ export class SchedulerService {
 
     try {
       log.info('Executing noon mode handler...');
-      const results = await this.noonModeHandler.execute(this.lockManager);
+      const results = await this.noonModeHandler.execute(this.lockManager, startAt);
 
       const completedAt = new Date();
       this.lastNoonRun = completedAt;
@@ -0,0 +1,83 @@
+/**
+ * Precise timing helpers for the noon booking window
+ *
+ * setTimeout only guarantees a minimum delay and routinely wakes several
+ * milliseconds late, which matters when racing other bookers at 12:00:00.
+ * waitUntil() sleeps coarsely and then spins on the monotonic clock for the
+ * last few milliseconds so the first request leaves as close to the deadline
+ * as possible.
+ */
+
+import * as os from 'os';
+import { performance } from 'perf_hooks';
+import { createLogger } from '../logger';
+
+const log = createLogger('Scheduler:Timing');
+
+const SPIN_WINDOW_MS = 5; // Busy-wait only for the final few milliseconds
+const BURST_PRIORITY = os.constants.priority.PRIORITY_HIGH; // nice -14; raising it needs CAP_SYS_NICE
+
+/**
+ * Get the closest whole-minute boundary (epoch ms) to the given time
+ * Rounding (rather than ceiling) keeps a late trigger at 12:00:00.3 targeting 12:00, not 12:01
+ */
+export function nearestMinuteBoundary(nowMs: number = Date.now()): number {
+  return Math.round(nowMs / 60000) * 60000;
+}
+
+/**
+ * Wait until an absolute wall-clock deadline (epoch ms)
+ * The deadline is converted to monotonic time once, so clock adjustments during the wait don't move it
+ */
+export async function waitUntil(deadlineMs: number): Promise<void> {
+  const deadlineMono = performance.now() + (deadlineMs - Date.now());
+
+  const coarseMs = deadlineMono - performance.now() - SPIN_WINDOW_MS;
+  if (coarseMs > 0) {
+    await new Promise((resolve) => setTimeout(resolve, coarseMs));
+  }
+
+  while (performance.now() < deadlineMono) {
+    // Spin for the final few milliseconds
+  }
+}
+
+/**
+ * Sleep until a monotonic deadline (performance.now() ms) without spinning
+ * Used for paced retries, where several jobs share the event loop and sub-ms precision doesn't matter
+ */
+export async function sleepUntilMonotonic(deadlineMono: number): Promise<void> {
+  const remainingMs = deadlineMono - performance.now();
+  if (remainingMs > 0) {
+    await new Promise((resolve) => setTimeout(resolve, remainingMs));
+  }
+}
+
+/**
+ * Raise the scheduling priority of the event loop thread for the booking burst
+ * Other processes on the host then can't delay it at 12:00; a no-op without permission to raise it
+ * @returns Restores the previous priority
+ */
+export function raiseProcessPriority(): () => void {
+  let previous: number;
+  try {
+    previous = os.getPriority();
+    os.setPriority(BURST_PRIORITY);
+  } catch (error) {
+    log.debug('Could not raise process priority', {
+      error: error instanceof Error ? error.message : String(error),
+    });
+    return () => {};
+  }
+
+  log.debug('Process priority raised for booking burst', { from: previous, to: BURST_PRIORITY });
+  return () => {
+    try {
+      os.setPriority(previous);
+    } catch (error) {
+      log.warn('Could not restore process priority', {
+        error: error instanceof Error ? error.message : String(error),
+      });
+    }
+  };
+}
@@ -24,7 +24,8 @@ export interface PreparedJob {
   timeSlots: string[]; // HH:MM format, ordered by preference
   durations: number[]; // minutes, longest first
   courtAvailability: Map<string, number[]>; // key: "HH:MM-duration" -> court IDs
-  preFetchedForms: Map<string, PreFetchedForm>; // key: "HH:MM-duration-courtId" -> pre-fetched form data
+  preFetchedForms: Map<string, PreFetchedForm>; // key: "HH:MM-duration" -> pre-fetched form data (shared by all courts)
+  firstChoice: { timeSlot: string; duration: number; courtId: number } | null; // Highest-priority court, probed until the window opens
 }
 
 export interface BookingAttempt {
@@ -48,6 +49,7 @@ export interface JobResult {
   startTime?: string;
   duration?: number;
   errorMessage?: string;
+  sentRequests?: boolean; // Whether the job sent any CourtReserve requests (polling spaces those jobs out)
 }
 
 export interface SchedulerRunResult {
@@ -32,7 +32,7 @@ console.log(`=====================================\n`);
 log.info('Scheduler process starting');
 log.info('Schedule configuration', {
   noonPreparation: '11:59:50 AM Pacific',
-  noonExecution: '12:00:00 PM Pacific',
+  noonExecution: '12:00:00 PM Pacific (armed at 11:59:59)',
   pollingMode: 'Every 15 minutes',
 });
 